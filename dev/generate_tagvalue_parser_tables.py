@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2023 spdx contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Regenerates the LALR tables of the tag-value parser shipped in src/spdx_tools/spdx/parser/tagvalue/parsetab.py.
+Run this from the repo root whenever a grammar rule of the tag-value parser changes:
+
+    python dev/generate_tagvalue_parser_tables.py
+"""
+import os
+import sys
+
+from spdx_tools.spdx.parser.tagvalue import parser
+
+
+def main():
+    if os.environ.get("PYTHONHASHSEED") != "0":
+        # PLY iterates over sets while building the tables, a fixed hash seed keeps the generated file stable
+        os.execve(sys.executable, [sys.executable, *sys.argv], {**os.environ, "PYTHONHASHSEED": "0"})
+    tables_path = os.path.join(os.path.dirname(parser.__file__), "parsetab.py")
+    if os.path.exists(tables_path):
+        os.remove(tables_path)
+    parser.Parser(optimize=False, write_tables=True)
+    print(f"Wrote {tables_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from dataclasses import fields
+from functools import lru_cache
 
-from beartype.typing import Any, Dict
+from beartype.typing import Any, Dict, Tuple
 
 from spdx_tools.common.typing.constructor_type_errors import ConstructorTypeErrors
 
@@ -19,8 +20,7 @@ def check_types_and_set_values(instance_under_construction: Any, local_variables
     https://youtrack.jetbrains.com/issue/PY-34569
     """
     errors = []
-    for field in fields(instance_under_construction):
-        key = field.name
+    for key in get_field_names(type(instance_under_construction)):
         value = local_variables.get(key)
         try:
             setattr(instance_under_construction, key, value)
@@ -29,3 +29,9 @@ def check_types_and_set_values(instance_under_construction: Any, local_variables
             errors.append(error_message)
     if errors:
         raise ConstructorTypeErrors(errors)
+
+
+@lru_cache(maxsize=None)
+def get_field_names(cls: type) -> Tuple[str, ...]:
+    """The dataclass fields of a model class never change, so they only need to be looked up once per class."""
+    return tuple(field.name for field in fields(cls))
@@ -2,12 +2,40 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from datetime import datetime
+from functools import lru_cache
 
 
 def datetime_from_str(date_str: str) -> datetime:
     if not isinstance(date_str, str):
         raise TypeError(f"Could not convert str to datetime, invalid type: {type(date_str).__name__}")
 
+    return datetime_from_iso_string(date_str)
+
+
+# strptime is comparatively slow and documents tend to repeat the same dates, datetime objects are immutable so they
+# can safely be shared
+@lru_cache(maxsize=2048)
+def datetime_from_iso_string(date_str: str) -> datetime:
+    # fast path for the fixed width format all SPDX dates use, anything else is left to strptime
+    if (
+        len(date_str) == 20
+        and date_str.isascii()
+        and date_str[4::3] == "--T::Z"
+        and date_str[:4].isdigit()
+        and all(date_str[index : index + 2].isdigit() for index in (5, 8, 11, 14, 17))
+    ):
+        try:
+            return datetime(
+                int(date_str[:4]),
+                int(date_str[5:7]),
+                int(date_str[8:10]),
+                int(date_str[11:13]),
+                int(date_str[14:16]),
+                int(date_str[17:19]),
+            )
+        except ValueError:
+            pass  # out of range values like a month 13, strptime raises the usual error for these
+
     date = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")  # raises ValueError if format does not match
     return date
 
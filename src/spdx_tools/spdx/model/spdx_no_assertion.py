@@ -18,3 +18,6 @@ class SpdxNoAssertion:
 
     def __eq__(self, other):
         return isinstance(other, SpdxNoAssertion)
+
+    def __hash__(self):
+        return hash(SPDX_NO_ASSERTION_STRING)
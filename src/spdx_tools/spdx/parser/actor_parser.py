@@ -2,52 +2,57 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import re
+from functools import lru_cache
 
-from beartype.typing import Match, Pattern
+from beartype.typing import Match, Optional, Pattern, Tuple
 
 from spdx_tools.spdx.model import Actor, ActorType
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.parsing_functions import construct_or_raise_parsing_error
 
+TOOL_REGEX: Pattern = re.compile(r"^Tool:\s*(.+)", re.UNICODE)
+PERSON_REGEX: Pattern = re.compile(r"^Person:\s*(?:(.*)\((.*)\)|(.*))$", re.UNICODE)
+ORGANIZATION_REGEX: Pattern = re.compile(r"^Organization:\s*(?:(.*)\((.*)\)|(.*))$", re.UNICODE)
+
 
 class ActorParser:
     @staticmethod
     def parse_actor(actor: str) -> Actor:
-        tool_re: Pattern = re.compile(r"^Tool:\s*(.+)", re.UNICODE)
-        person_re: Pattern = re.compile(r"^Person:\s*(?:(.*)\((.*)\)|(.*))$", re.UNICODE)
-        org_re: Pattern = re.compile(r"^Organization:\s*(?:(.*)\((.*)\)|(.*))$", re.UNICODE)
-        tool_match: Match = tool_re.match(actor)
-        person_match: Match = person_re.match(actor)
-        org_match: Match = org_re.match(actor)
-
-        if tool_match:
-            name: str = tool_match.group(1).strip()
-            if not name:
-                raise SPDXParsingError([f"No name for Tool provided: {actor}."])
-            return construct_or_raise_parsing_error(Actor, dict(actor_type=ActorType.TOOL, name=name))
-
-        if person_match:
-            actor_type = ActorType.PERSON
-            match = person_match
-        elif org_match:
-            actor_type = ActorType.ORGANIZATION
-            match = org_match
-        else:
-            raise SPDXParsingError([f"Actor {actor} doesn't match any of person, organization or tool."])
-
-        if match.group(3):
-            return construct_or_raise_parsing_error(
-                Actor, dict(actor_type=actor_type, name=match.group(3).strip(), email=None)
-            )
+        # only the values are cached, every caller still gets its own (mutable) Actor
+        actor_type, name, email = parse_actor_values(actor)
+        return construct_or_raise_parsing_error(Actor, dict(actor_type=actor_type, name=name, email=email))
+
+
+@lru_cache(maxsize=1024)
+def parse_actor_values(actor: str) -> Tuple[ActorType, str, Optional[str]]:
+    tool_match: Match = TOOL_REGEX.match(actor)
+    person_match: Match = PERSON_REGEX.match(actor)
+    org_match: Match = ORGANIZATION_REGEX.match(actor)
+
+    if tool_match:
+        name: str = tool_match.group(1).strip()
+        if not name:
+            raise SPDXParsingError([f"No name for Tool provided: {actor}."])
+        return ActorType.TOOL, name, None
+
+    if person_match:
+        actor_type = ActorType.PERSON
+        match = person_match
+    elif org_match:
+        actor_type = ActorType.ORGANIZATION
+        match = org_match
+    else:
+        raise SPDXParsingError([f"Actor {actor} doesn't match any of person, organization or tool."])
+
+    if match.group(3):
+        return actor_type, match.group(3).strip(), None
+    else:
+        name = match.group(1)
+        if not name:
+            raise SPDXParsingError([f"No name for Actor provided: {actor}."])
         else:
-            name = match.group(1)
-            if not name:
-                raise SPDXParsingError([f"No name for Actor provided: {actor}."])
-            else:
-                name = name.strip()
+            name = name.strip()
 
-            email = match.group(2).strip()
+        email = match.group(2).strip()
 
-            return construct_or_raise_parsing_error(
-                Actor, dict(actor_type=actor_type, name=name, email=email if email else None)
-            )
+        return actor_type, name, email if email else None
@@ -1,10 +1,12 @@
 # SPDX-FileCopyrightText: 2022 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
-from beartype.typing import Dict, List, Optional
+import sys
+from functools import lru_cache
 
-from spdx_tools.common.typing.constructor_type_errors import ConstructorTypeErrors
-from spdx_tools.spdx.model import Relationship, RelationshipType
+from beartype.typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from spdx_tools.spdx.model import Relationship, RelationshipType, SpdxNoAssertion, SpdxNone
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.parser.jsonlikedict.dict_parsing_functions import (
     delete_duplicates_from_list,
@@ -18,6 +20,30 @@ from spdx_tools.spdx.parser.parsing_functions import (
     raise_parsing_error_if_logger_has_messages,
 )
 
+# spdx_element_id, relationship_type and related_spdx_element_id of a relationship; the comment is not part of the key
+# as it is not relevant for the question whether a relationship is a duplicate.
+# The deduplication is dominated by hashing and comparing these string ids, which the built-in set and tuple types
+# already do in C. Keep these helpers on plain Python sets: JIT-compiled typed containers (e.g. numba's typed.Dict)
+# are considerably slower for string keys.
+RelationshipKey = Tuple[str, RelationshipType, Union[str, SpdxNone, SpdxNoAssertion]]
+
+# pairs of relationship types that express the same relationship with swapped elements, e.g. "A CONTAINS B" is
+# equivalent to "B CONTAINED_BY A"; types without an inverse are only compared in their original direction
+INVERTED_RELATIONSHIP_TYPES: Dict[RelationshipType, RelationshipType] = {
+    RelationshipType.DESCRIBES: RelationshipType.DESCRIBED_BY,
+    RelationshipType.DESCRIBED_BY: RelationshipType.DESCRIBES,
+    RelationshipType.CONTAINS: RelationshipType.CONTAINED_BY,
+    RelationshipType.CONTAINED_BY: RelationshipType.CONTAINS,
+    RelationshipType.DEPENDS_ON: RelationshipType.DEPENDENCY_OF,
+    RelationshipType.DEPENDENCY_OF: RelationshipType.DEPENDS_ON,
+    RelationshipType.GENERATES: RelationshipType.GENERATED_FROM,
+    RelationshipType.GENERATED_FROM: RelationshipType.GENERATES,
+    RelationshipType.ANCESTOR_OF: RelationshipType.DESCENDANT_OF,
+    RelationshipType.DESCENDANT_OF: RelationshipType.ANCESTOR_OF,
+    RelationshipType.HAS_PREREQUISITE: RelationshipType.PREREQUISITE_FOR,
+    RelationshipType.PREREQUISITE_FOR: RelationshipType.HAS_PREREQUISITE,
+}
+
 
 class RelationshipParser:
     logger: Logger
@@ -26,13 +52,18 @@ class RelationshipParser:
         self.logger = Logger()
 
     def parse_all_relationships(self, input_doc_dict: Dict) -> List[Relationship]:
-        relationships = []
         relationship_dicts: List[Dict] = input_doc_dict.get("relationships", [])
-        relationships.extend(
-            parse_field_or_log_error(self.logger, relationship_dicts, self.parse_relationship, [], True)
+        # the explicitly listed relationships usually make up the bulk of all relationships, so we use the parsed list
+        # directly instead of copying it into a new one; the relationships derived from deprecated fields are appended
+        relationships: List[Relationship] = parse_field_or_log_error(
+            self.logger, relationship_dicts, self.parse_relationship, [], True
         )
 
-        document_describes: List[str] = delete_duplicates_from_list(input_doc_dict.get("documentDescribes", []))
+        # the keys are shared by all of the following passes and updated with every relationship they add, so the
+        # existing relationships only need to be processed once
+        existing_relationship_keys: Set[RelationshipKey] = self.get_relationship_keys(relationships)
+
+        document_describes: List[str] = input_doc_dict.get("documentDescribes", [])
         doc_spdx_id: Optional[str] = input_doc_dict.get("SPDXID")
 
         relationships.extend(
@@ -40,7 +71,10 @@ class RelationshipParser:
                 self.logger,
                 document_describes,
                 lambda x: self.parse_document_describes(
-                    doc_spdx_id=doc_spdx_id, described_spdx_ids=x, existing_relationships=relationships
+                    doc_spdx_id=doc_spdx_id,
+                    described_spdx_ids=delete_duplicates_from_list(x),
+                    existing_relationships=relationships,
+                    existing_relationship_keys=existing_relationship_keys,
                 ),
                 [],
             )
@@ -52,7 +86,11 @@ class RelationshipParser:
             parse_field_or_log_error(
                 self.logger,
                 package_dicts,
-                lambda x: self.parse_has_files(package_dicts=x, existing_relationships=relationships),
+                lambda x: self.parse_has_files(
+                    package_dicts=x,
+                    existing_relationships=relationships,
+                    existing_relationship_keys=existing_relationship_keys,
+                ),
                 [],
             )
         )
@@ -60,8 +98,8 @@ class RelationshipParser:
         file_dicts: List[Dict] = input_doc_dict.get("files", [])
 
         # not implemented yet: deal with deprecated fields in file:
-        # https://github.com/spdx/tools-python/issues/294 & https://github.com/spdx/tools-python/issues/387
-        _ = self.parse_artifact_of(file_dicts=file_dicts)
+        # https://github.com/spdx/tools-python/issues/387
+        # artifactOfs (https://github.com/spdx/tools-python/issues/294) are not handled yet, see parse_artifact_of
         _ = self.parse_file_dependencies(file_dicts=file_dicts)
 
         raise_parsing_error_if_logger_has_messages(self.logger)
@@ -69,16 +107,20 @@ class RelationshipParser:
         return relationships
 
     def parse_relationship(self, relationship_dict: Dict) -> Relationship:
-        logger = Logger()
-        spdx_element_id: Optional[str] = relationship_dict.get("spdxElementId")
+        spdx_element_id: Optional[str] = intern_spdx_id(relationship_dict.get("spdxElementId"))
         related_spdx_element: Optional[str] = parse_field_or_no_assertion_or_none(
-            relationship_dict.get("relatedSpdxElement")
-        )
-        relationship_type: Optional[RelationshipType] = parse_field_or_log_error(
-            logger, relationship_dict.get("relationshipType"), self.parse_relationship_type
+            relationship_dict.get("relatedSpdxElement"), intern_spdx_id
         )
+        relationship_type: Optional[RelationshipType] = None
+        relationship_type_str: Optional[str] = relationship_dict.get("relationshipType")
+        if relationship_type_str:
+            # the relationship type is the only field that needs parsing, so we raise its error directly instead of
+            # collecting it in a logger that stays empty for the vast majority of relationships
+            try:
+                relationship_type = self.parse_relationship_type(relationship_type_str)
+            except SPDXParsingError as err:
+                raise SPDXParsingError([f"Error while parsing Relationship: {err.get_messages()}"])
         relationship_comment: Optional[str] = relationship_dict.get("comment")
-        raise_parsing_error_if_logger_has_messages(logger, "Relationship")
 
         relationship = construct_or_raise_parsing_error(
             Relationship,
@@ -93,101 +135,122 @@ class RelationshipParser:
 
     @staticmethod
     def parse_relationship_type(relationship_type_str: str) -> RelationshipType:
-        try:
-            relationship_type = RelationshipType[json_str_to_enum_name(relationship_type_str)]
-        except KeyError:
-            raise SPDXParsingError([f"Invalid RelationshipType: {relationship_type_str}"])
-        return relationship_type
+        if not isinstance(relationship_type_str, str):
+            # lru_cache can't handle unhashable values, so we have to reject values of the wrong type beforehand
+            raise SPDXParsingError([f"Type for enum must be str not {type(relationship_type_str).__name__}"])
+        return parse_relationship_type_str(relationship_type_str)
 
     def parse_document_describes(
-        self, doc_spdx_id: str, described_spdx_ids: List[str], existing_relationships: List[Relationship]
+        self,
+        doc_spdx_id: str,
+        described_spdx_ids: List[str],
+        existing_relationships: List[Relationship],
+        existing_relationship_keys: Optional[Set[RelationshipKey]] = None,
     ) -> List[Relationship]:
-        logger = Logger()
-        describes_relationships = []
-        for spdx_id in described_spdx_ids:
-            try:
-                describes_relationship = Relationship(
-                    spdx_element_id=doc_spdx_id,
-                    relationship_type=RelationshipType.DESCRIBES,
-                    related_spdx_element_id=spdx_id,
-                )
-            except ConstructorTypeErrors as err:
-                logger.append(err.get_messages())
-                continue
-            if not self.check_if_relationship_exists(describes_relationship, existing_relationships):
-                describes_relationships.append(describes_relationship)
-        raise_parsing_error_if_logger_has_messages(logger, "document describes relationships")
+        if not isinstance(doc_spdx_id, str):
+            # all describes relationships would fail to be constructed for the same reason, so we report it only once
+            raise SPDXParsingError(
+                [
+                    "Error while parsing document describes relationships: "
+                    f"['Invalid SPDXID of document: {doc_spdx_id}']"
+                ]
+            )
+        invalid_spdx_ids: List[Any] = [spdx_id for spdx_id in described_spdx_ids if not isinstance(spdx_id, str)]
+        if invalid_spdx_ids:
+            raise SPDXParsingError(
+                [
+                    "Error while parsing document describes relationships: "
+                    f"['Invalid SPDXIDs of described elements: {invalid_spdx_ids}']"
+                ]
+            )
+        if existing_relationship_keys is None:
+            existing_relationship_keys = self.get_relationship_keys(existing_relationships)
 
-        return describes_relationships
+        # as all ids are valid strings, constructing the relationships can't fail; we check for duplicates beforehand
+        # to skip the type checks of the constructor for relationships that already exist
+        doc_spdx_id = intern_spdx_id(doc_spdx_id)
+        relationship_keys: List[RelationshipKey] = [
+            (doc_spdx_id, RelationshipType.DESCRIBES, intern_spdx_id(spdx_id))
+            for spdx_id in described_spdx_ids
+            if not self.check_if_relationship_key_exists(
+                (doc_spdx_id, RelationshipType.DESCRIBES, spdx_id), existing_relationship_keys
+            )
+        ]
+        existing_relationship_keys.update(relationship_keys)
+
+        return [Relationship(*relationship_key) for relationship_key in relationship_keys]
 
     def parse_has_files(
-        self, package_dicts: List[Dict], existing_relationships: List[Relationship]
+        self,
+        package_dicts: List[Dict],
+        existing_relationships: List[Relationship],
+        existing_relationship_keys: Optional[Set[RelationshipKey]] = None,
     ) -> List[Relationship]:
         logger = Logger()
-        contains_relationships = []
-        for package in package_dicts:
-            package_spdx_id: Optional[str] = package.get("SPDXID")
-            contained_files: List[str] = delete_duplicates_from_list(package.get("hasFiles", []))
-            if not contained_files:
+        if existing_relationship_keys is None:
+            existing_relationship_keys = self.get_relationship_keys(existing_relationships)
+        relationship_keys: List[RelationshipKey] = []
+        # most packages don't list their files via hasFiles, so we skip those before looking at any other field
+        packages_with_files: List[Tuple[Optional[str], List[str]]] = [
+            (package.get("SPDXID"), package["hasFiles"]) for package in package_dicts if package.get("hasFiles")
+        ]
+        for package_spdx_id, has_files in packages_with_files:
+            if not isinstance(package_spdx_id, str):
+                logger.append(f"Invalid SPDXID of package with hasFiles: {package_spdx_id}")
+                continue
+            invalid_file_spdx_ids: List[Any] = [
+                file_spdx_id for file_spdx_id in has_files if not isinstance(file_spdx_id, str)
+            ]
+            if invalid_file_spdx_ids:
+                logger.append(f"Invalid SPDXIDs in hasFiles of package {package_spdx_id}: {invalid_file_spdx_ids}")
                 continue
-            for file_spdx_id in contained_files:
-                try:
-                    contains_relationship = Relationship(
-                        spdx_element_id=package_spdx_id,
-                        relationship_type=RelationshipType.CONTAINS,
-                        related_spdx_element_id=file_spdx_id,
-                    )
-                except ConstructorTypeErrors as err:
-                    logger.append(err.get_messages())
-                    continue
-                if not self.check_if_relationship_exists(
-                    relationship=contains_relationship, existing_relationships=existing_relationships
-                ):
-                    contains_relationships.append(contains_relationship)
+            package_spdx_id = intern_spdx_id(package_spdx_id)
+            package_relationship_keys: List[RelationshipKey] = [
+                (package_spdx_id, RelationshipType.CONTAINS, intern_spdx_id(file_spdx_id))
+                for file_spdx_id in delete_duplicates_from_list(has_files)
+                if not self.check_if_relationship_key_exists(
+                    (package_spdx_id, RelationshipType.CONTAINS, file_spdx_id), existing_relationship_keys
+                )
+            ]
+            # the same package may be listed more than once, so its keys need to be known before the next package
+            existing_relationship_keys.update(package_relationship_keys)
+            relationship_keys.extend(package_relationship_keys)
         raise_parsing_error_if_logger_has_messages(logger, "package contains relationships")
 
-        return contains_relationships
+        return [Relationship(*relationship_key) for relationship_key in relationship_keys]
 
     def check_if_relationship_exists(
         self, relationship: Relationship, existing_relationships: List[Relationship]
     ) -> bool:
-        existing_relationships_without_comments: List[Relationship] = self.get_all_relationships_without_comments(
-            existing_relationships
+        return self.check_if_relationship_key_exists(
+            self.get_relationship_key(relationship), self.get_relationship_keys(existing_relationships)
         )
-        if relationship in existing_relationships_without_comments:
+
+    def check_if_relationship_key_exists(
+        self, relationship_key: RelationshipKey, existing_relationship_keys: Set[RelationshipKey]
+    ) -> bool:
+        if relationship_key in existing_relationship_keys:
             return True
-        relationship_inverted: Relationship = self.invert_relationship(relationship)
-        if relationship_inverted in existing_relationships_without_comments:
+        relationship_key_inverted: Optional[RelationshipKey] = self.invert_relationship_key(relationship_key)
+        if relationship_key_inverted and relationship_key_inverted in existing_relationship_keys:
             return True
 
         return False
 
     @staticmethod
-    def get_all_relationships_without_comments(existing_relationships: List[Relationship]) -> List[Relationship]:
-        relationships_without_comments = [
-            Relationship(
-                relationship_type=relationship.relationship_type,
-                related_spdx_element_id=relationship.related_spdx_element_id,
-                spdx_element_id=relationship.spdx_element_id,
-            )
-            for relationship in existing_relationships
-        ]
-        return relationships_without_comments
-
-    def invert_relationship(self, relationship: Relationship) -> Relationship:
-        return Relationship(
-            related_spdx_element_id=relationship.spdx_element_id,
-            spdx_element_id=relationship.related_spdx_element_id,
-            relationship_type=self.invert_relationship_types[relationship.relationship_type],
-            comment=relationship.comment,
-        )
+    def get_relationship_key(relationship: Relationship) -> RelationshipKey:
+        return relationship.spdx_element_id, relationship.relationship_type, relationship.related_spdx_element_id
 
-    invert_relationship_types = {
-        RelationshipType.DESCRIBES: RelationshipType.DESCRIBED_BY,
-        RelationshipType.DESCRIBED_BY: RelationshipType.DESCRIBES,
-        RelationshipType.CONTAINS: RelationshipType.CONTAINED_BY,
-        RelationshipType.CONTAINED_BY: RelationshipType.CONTAINS,
-    }
+    def get_relationship_keys(self, relationships: List[Relationship]) -> Set[RelationshipKey]:
+        return {self.get_relationship_key(relationship) for relationship in relationships}
+
+    @staticmethod
+    def invert_relationship_key(relationship_key: RelationshipKey) -> Optional[RelationshipKey]:
+        spdx_element_id, relationship_type, related_spdx_element_id = relationship_key
+        inverted_relationship_type: Optional[RelationshipType] = INVERTED_RELATIONSHIP_TYPES.get(relationship_type)
+        if not inverted_relationship_type:
+            return None
+        return related_spdx_element_id, inverted_relationship_type, spdx_element_id
 
     @staticmethod
     def parse_file_dependencies(file_dicts: List[Dict]) -> List[Relationship]:
@@ -198,7 +261,27 @@ class RelationshipParser:
 
     @staticmethod
     def parse_artifact_of(file_dicts: List[Dict]) -> List[Relationship]:
+        # not called by parse_all_relationships until this is implemented, kept for backwards compatibility
         generated_relationships = []
         # artifactOfs is deprecated and should be converted to an external package and a generated from relationship
         # https://github.com/spdx/tools-python/issues/294
         return generated_relationships
+
+
+def intern_spdx_id(spdx_id: Any) -> Any:
+    # SPDX ids are repeated across relationships, hasFiles and documentDescribes; interning them lets the relationship
+    # keys share a single string object per id, so equality checks during deduplication can short-circuit on identity
+    if type(spdx_id) is str:
+        return sys.intern(spdx_id)
+    return spdx_id
+
+
+@lru_cache(maxsize=None)
+def parse_relationship_type_str(relationship_type_str: str) -> RelationshipType:
+    # documents usually only use a handful of different relationship types, so the conversion is only done once per
+    # distinct value; failed conversions raise and are therefore not cached
+    try:
+        relationship_type = RelationshipType[json_str_to_enum_name(relationship_type_str)]
+    except KeyError:
+        raise SPDXParsingError([f"Invalid RelationshipType: {relationship_type_str}"])
+    return relationship_type
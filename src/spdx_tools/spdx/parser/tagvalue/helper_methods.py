@@ -92,6 +92,9 @@ TAG_DATA_MODEL_FIELD = {
     "LicenseListVersion": (CreationInfo, "license_list_version"),
     "ExternalDocumentRef": (CreationInfo, "external_document_refs"),
     "FileName": (File, "name"),
+    "FileContributor": (File, "contributors"),
+    "FileAttributionText": (File, "attribution_texts"),
+    "LicenseInfoInFile": (File, "license_info_in_file"),
     "FileType": (File, "file_type"),
     "FileChecksum": (File, "checksums"),
     "FileNotice": (File, "notice"),
@@ -115,6 +118,8 @@ TAG_DATA_MODEL_FIELD = {
     "PackageOriginator": (Package, "originator"),
     "PackageDescription": (Package, "description"),
     "PackageHomePage": (Package, "homepage"),
+    "PackageAttributionText": (Package, "attribution_texts"),
+    "PackageLicenseInfoFromFiles": (Package, "license_info_from_files"),
     "SnippetSPDXID": (Snippet, "spdx_id"),
     "SnippetFromFileSPDXID": (Snippet, "file_spdx_id"),
     "SnippetName": (Snippet, "name"),
@@ -124,6 +129,8 @@ TAG_DATA_MODEL_FIELD = {
     "SnippetLicenseConcluded": (Snippet, "license_concluded"),
     "SnippetByteRange": (Snippet, "byte_range"),
     "SnippetLineRange": (Snippet, "line_range"),
+    "SnippetAttributionText": (Snippet, "attribution_texts"),
+    "LicenseInfoInSnippet": (Snippet, "license_info_in_snippet"),
     "Annotator": (Annotation, "annotator"),
     "SPDXREF": (Annotation, "spdx_id"),
     "AnnotationComment": (Annotation, "annotation_comment"),
@@ -131,4 +138,5 @@ TAG_DATA_MODEL_FIELD = {
     "ExtractedText": (ExtractedLicensingInfo, "extracted_text"),
     "LicenseComment": (ExtractedLicensingInfo, "comment"),
     "LicenseName": (ExtractedLicensingInfo, "license_name"),
+    "LicenseCrossReference": (ExtractedLicensingInfo, "cross_references"),
 }
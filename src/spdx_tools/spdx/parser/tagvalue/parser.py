@@ -12,9 +12,11 @@
 # limitations under the License.
 
 import re
+import sys
+from functools import lru_cache
 
-from beartype.typing import Any, Dict, List
-from license_expression import get_spdx_licensing
+from beartype.typing import Any, Dict, List, Set, Tuple
+from license_expression import LicenseExpression, Licensing, get_spdx_licensing
 from ply import yacc
 from ply.yacc import LRParser
 
@@ -56,22 +58,57 @@ from spdx_tools.spdx.parser.tagvalue.helper_methods import (
 )
 from spdx_tools.spdx.parser.tagvalue.lexer import SPDXLexer
 
-CLASS_MAPPING = dict(
-    File="files",
-    Annotation="annotations",
-    Relationship="relationships",
-    Snippet="snippets",
-    Package="packages",
-    ExtractedLicensingInfo="extracted_licensing_info",
-)
-ELEMENT_EXPECTED_START_TAG = dict(
-    File="FileName",
-    Annotation="Annotator",
-    Relationship="Relationship",
-    Snippet="SnippetSPDXID",
-    Package="PackageName",
-    ExtractedLicensingInfo="LicenseID",
-)
+CLASS_MAPPING = {
+    File: "files",
+    Annotation: "annotations",
+    Relationship: "relationships",
+    Snippet: "snippets",
+    Package: "packages",
+    ExtractedLicensingInfo: "extracted_licensing_info",
+}
+ELEMENT_EXPECTED_START_TAG = {
+    File: "FileName",
+    Annotation: "Annotator",
+    Relationship: "Relationship",
+    Snippet: "SnippetSPDXID",
+    Package: "PackageName",
+    ExtractedLicensingInfo: "LicenseID",
+}
+# inverse of ELEMENT_EXPECTED_START_TAG, so that the element started by a tag can be found with a single lookup
+START_TAG_ELEMENT_CLASS = {start_tag: clazz for clazz, start_tag in ELEMENT_EXPECTED_START_TAG.items()}
+ELEMENT_NOT_IN_SCOPE_MESSAGE = {
+    clazz: f"Element {clazz.__name__} is not the current element in scope, probably the expected tag to start the "
+    f"element ({start_tag}) is missing. "
+    for clazz, start_tag in ELEMENT_EXPECTED_START_TAG.items()
+}
+# list fields that are optional in the data model, these are initialized with the element so that parsed values can be
+# appended directly; required list fields like File.checksums are only added with their first value
+ELEMENT_LIST_FIELDS = {
+    File: ["file_types", "license_info_in_file", "contributors", "attribution_texts"],
+    Package: ["checksums", "license_info_from_files", "external_references", "attribution_texts"],
+    Snippet: ["license_info_in_snippet", "attribution_texts"],
+    ExtractedLicensingInfo: ["cross_references"],
+}
+FILE_TYPES = dict(FileType.__members__)
+# the spec uses dashes in the category names, the data model underscores; both are accepted
+EXTERNAL_PACKAGE_REF_CATEGORIES = {
+    **ExternalPackageRefCategory.__members__,
+    **{name.replace("_", "-"): category for name, category in ExternalPackageRefCategory.__members__.items()},
+}
+# the spec uses dashes in the purpose names, the data model underscores; both are accepted
+PACKAGE_PURPOSES = {
+    **PackagePurpose.__members__,
+    **{name.replace("_", "-"): purpose for name, purpose in PackagePurpose.__members__.items()},
+}
+FILES_ANALYZED_VALUES = {"true": True, "True": True, "false": False, "False": False}
+ANNOTATION_TYPES = dict(AnnotationType.__members__)
+RELATIONSHIP_TYPES = dict(RelationshipType.__members__)
+# the sentinel values carry no state, so one instance each is shared by all parsed elements
+SPDX_NO_ASSERTION = SpdxNoAssertion()
+SPDX_NONE = SpdxNone()
+SPDX_SENTINELS = {"NOASSERTION": SPDX_NO_ASSERTION, "NONE": SPDX_NONE}
+VERIFICATION_CODE_REGEX = re.compile(r"([0-9a-f]{40})\s*(\(excludes:\s*(.+)\))?", re.UNICODE)
+SNIPPET_RANGE_REGEX = re.compile(r"^(\d+):(\d+)$", re.UNICODE)
 
 
 class Parser:
@@ -80,6 +117,7 @@ class Parser:
     current_element: Dict[str, Any]
     creation_info: Dict[str, Any]
     elements_built: Dict[str, Any]
+    relationship_keys: Set[Tuple]
     lex: SPDXLexer
     yacc: LRParser
 
@@ -87,11 +125,15 @@ class Parser:
         self.tokens = SPDXLexer.tokens
         self.logger = Logger()
         self.current_element = {"logger": Logger()}
-        self.creation_info = {"logger": Logger()}
+        self.creation_info = {"logger": Logger(), "external_document_refs": []}
         self.elements_built = dict()
+        self.relationship_keys = set()
         self.lex = SPDXLexer()
-        self.lex.build(reflags=re.UNICODE)
-        self.yacc = yacc.yacc(module=self, **kwargs)
+        # str patterns are unicode-aware by default, the flags only need to override PLY's default of re.VERBOSE
+        self.lex.build(reflags=0)
+        # The LALR tables are read from the shipped parsetab module without validating the grammar or comparing its
+        # signature, run dev/generate_tagvalue_parser_tables.py after changing a grammar rule.
+        self.yacc = yacc.yacc(module=self, **{"optimize": True, "debug": False, "write_tables": False, **kwargs})
 
     @grammar_rule("start : start attrib ")
     def p_start_start_attrib(self, p):
@@ -165,8 +207,8 @@ class Parser:
         "annotation_spdx_id : ANNOTATION_SPDX_ID error\n relationship : RELATIONSHIP error"
     )
     def p_current_element_error(self, p):
-        if p[1] in ELEMENT_EXPECTED_START_TAG.values():
-            self.initialize_new_current_element(TAG_DATA_MODEL_FIELD[p[1]][0])
+        if p[1] in START_TAG_ELEMENT_CLASS:
+            self.initialize_new_current_element(START_TAG_ELEMENT_CLASS[p[1]])
         self.current_element["logger"].append(
             f"Error while parsing {p[1]}: Token did not match specified grammar rule. Line: {p.lineno(1)}"
         )
@@ -200,11 +242,25 @@ class Parser:
         "annotation_comment : ANNOTATION_COMMENT text_or_line"
     )
     def p_generic_value(self, p):
-        if p[1] in ELEMENT_EXPECTED_START_TAG.values():
-            self.initialize_new_current_element(TAG_DATA_MODEL_FIELD[p[1]][0])
+        if p[1] in START_TAG_ELEMENT_CLASS:
+            self.initialize_new_current_element(START_TAG_ELEMENT_CLASS[p[1]])
         if self.check_that_current_element_matches_class_for_value(TAG_DATA_MODEL_FIELD[p[1]][0], p.lineno(1)):
             set_value(p, self.current_element)
 
+    @grammar_rule(
+        "license_cross_ref : LICENSE_CROSS_REF LINE\n file_contributor : FILE_CONTRIBUTOR LINE\n "
+        "file_attribution_text : FILE_ATTRIBUTION_TEXT text_or_line\n "
+        "file_license_info : FILE_LICENSE_INFO license_or_no_assertion_or_none\n "
+        "pkg_attribution_text : PKG_ATTRIBUTION_TEXT text_or_line\n "
+        "pkg_license_info : PKG_LICENSE_INFO license_or_no_assertion_or_none\n "
+        "snippet_attribution_text : SNIPPET_ATTRIBUTION_TEXT text_or_line\n "
+        "snippet_license_info : SNIPPET_LICENSE_INFO license_or_no_assertion_or_none"
+    )
+    def p_generic_list_value(self, p):
+        clazz, argument_name = TAG_DATA_MODEL_FIELD[p[1]]
+        if self.check_that_current_element_matches_class_for_value(clazz, p.lineno(1)):
+            self.current_element[argument_name].append(p[2])
+
     @grammar_rule(
         "unknown_tag : UNKNOWN_TAG text_or_line\n | UNKNOWN_TAG ISO8601_DATE\n | UNKNOWN_TAG PERSON_VALUE \n"
         "| UNKNOWN_TAG"
@@ -225,15 +281,15 @@ class Parser:
         "line_or_no_assertion : NO_ASSERTION\n line_or_no_assertion_or_none : NO_ASSERTION"
     )
     def p_no_assertion(self, p):
-        p[0] = SpdxNoAssertion()
+        p[0] = SPDX_NO_ASSERTION
 
     @grammar_rule("license_or_no_assertion_or_none : NONE\n line_or_no_assertion_or_none : NONE")
     def p_none(self, p):
-        p[0] = SpdxNone()
+        p[0] = SPDX_NONE
 
     @grammar_rule("license_or_no_assertion_or_none : LINE")
     def p_license(self, p):
-        p[0] = get_spdx_licensing().parse(p[1])
+        p[0] = parse_license_expression(p[1])
 
     @grammar_rule("actor_or_no_assertion : PERSON_VALUE\n | ORGANIZATION_VALUE")
     def p_actor_values(self, p):
@@ -244,10 +300,11 @@ class Parser:
         # As all SPDX Ids share the same tag, there is no knowing which spdx_id belongs to the document.
         # We assume that to be the first spdx_id we encounter. As the specification does not explicitly require this,
         # our approach might lead to unwanted behavior when the document's SPDX Id is defined later in the document.
+        # The ids are interned as they are repeated in relationships, which then share a single string per id.
         if "spdx_id" in self.creation_info:
-            self.current_element["spdx_id"] = p[2]
+            self.current_element["spdx_id"] = sys.intern(p[2])
         else:
-            self.creation_info["spdx_id"] = p[2]
+            self.creation_info["spdx_id"] = sys.intern(p[2])
 
     # parsing methods for creation info / document level
 
@@ -293,7 +350,7 @@ class Parser:
             return
         checksum = parse_checksum(external_doc_ref_match.group(2).strip())
         external_document_ref = ExternalDocumentRef(document_ref_id, document_uri, checksum)
-        self.creation_info.setdefault("external_document_refs", []).append(external_document_ref)
+        self.creation_info["external_document_refs"].append(external_document_ref)
 
     @grammar_rule("creator : CREATOR PERSON_VALUE\n| CREATOR TOOL_VALUE\n| CREATOR ORGANIZATION_VALUE")
     def p_creator(self, p):
@@ -303,40 +360,17 @@ class Parser:
     def p_created(self, p):
         set_value(p, self.creation_info, method_to_apply=datetime_from_str)
 
-    # parsing methods for extracted licensing info
-
-    @grammar_rule("license_cross_ref : LICENSE_CROSS_REF LINE")
-    def p_extracted_cross_reference(self, p):
-        if self.check_that_current_element_matches_class_for_value(ExtractedLicensingInfo, p.lineno(1)):
-            self.current_element.setdefault("cross_references", []).append(p[2])
-
     # parsing methods for file
 
-    @grammar_rule("file_contributor : FILE_CONTRIBUTOR LINE")
-    def p_file_contributor(self, p):
-        if self.check_that_current_element_matches_class_for_value(File, p.lineno(1)):
-            self.current_element.setdefault("contributors", []).append(p[2])
-
-    @grammar_rule("file_attribution_text : FILE_ATTRIBUTION_TEXT text_or_line")
-    def p_file_attribution_text(self, p):
-        if self.check_that_current_element_matches_class_for_value(File, p.lineno(1)):
-            self.current_element.setdefault("attribution_texts", []).append(p[2])
-
-    @grammar_rule("file_license_info : FILE_LICENSE_INFO license_or_no_assertion_or_none")
-    def p_file_license_info(self, p):
-        if self.check_that_current_element_matches_class_for_value(File, p.lineno(1)):
-            self.current_element.setdefault("license_info_in_file", []).append(p[2])
-
     @grammar_rule("file_type : FILE_TYPE LINE")
     def p_file_type(self, p):
         if not self.check_that_current_element_matches_class_for_value(File, p.lineno(1)):
             return
-        try:
-            file_type = FileType[p[2].strip()]
-        except KeyError:
+        file_type = FILE_TYPES.get(p[2].strip())
+        if file_type is None:
             self.current_element["logger"].append(f"Invalid FileType: {p[2]}. Line {p.lineno(1)}")
             return
-        self.current_element.setdefault("file_types", []).append(file_type)
+        self.current_element["file_types"].append(file_type)
 
     @grammar_rule("file_checksum : FILE_CHECKSUM CHECKSUM")
     def p_file_checksum(self, p):
@@ -347,20 +381,15 @@ class Parser:
 
     # parsing methods for package
 
-    @grammar_rule("pkg_attribution_text : PKG_ATTRIBUTION_TEXT text_or_line")
-    def p_pkg_attribution_text(self, p):
-        self.check_that_current_element_matches_class_for_value(Package, p.lineno(1))
-        self.current_element.setdefault("attribution_texts", []).append(p[2])
-
     @grammar_rule(
         "pkg_external_ref : PKG_EXTERNAL_REF LINE PKG_EXTERNAL_REF_COMMENT text_or_line\n | PKG_EXTERNAL_REF LINE"
     )
     def p_pkg_external_refs(self, p):
         if not self.check_that_current_element_matches_class_for_value(Package, p.lineno(1)):
             return
-        try:
-            category, reference_type, locator = p[2].split(" ")
-        except ValueError:
+        category, _, reference_type_and_locator = p[2].partition(" ")
+        reference_type, separator, locator = reference_type_and_locator.partition(" ")
+        if not separator or " " in locator:
             self.current_element["logger"].append(
                 f"Couldn't split PackageExternalRef in category, reference_type and locator. Line: {p.lineno(1)}"
             )
@@ -368,13 +397,12 @@ class Parser:
         comment = None
         if len(p) == 5:
             comment = p[4]
-        try:
-            category = ExternalPackageRefCategory[category.replace("-", "_")]
-        except KeyError:
+        if category not in EXTERNAL_PACKAGE_REF_CATEGORIES:
             self.current_element["logger"].append(
                 f"Invalid ExternalPackageRefCategory: {category}. Line: {p.lineno(1)}"
             )
             return
+        category = EXTERNAL_PACKAGE_REF_CATEGORIES[category]
         try:
             external_package_ref = construct_or_raise_parsing_error(
                 ExternalPackageRef,
@@ -383,19 +411,14 @@ class Parser:
         except SPDXParsingError as err:
             self.current_element["logger"].append(err.get_messages())
             return
-        self.current_element.setdefault("external_references", []).append(external_package_ref)
-
-    @grammar_rule("pkg_license_info : PKG_LICENSE_INFO license_or_no_assertion_or_none")
-    def p_pkg_license_info_from_file(self, p):
-        if self.check_that_current_element_matches_class_for_value(Package, p.lineno(1)):
-            self.current_element.setdefault("license_info_from_files", []).append(p[2])
+        self.current_element["external_references"].append(external_package_ref)
 
     @grammar_rule("pkg_checksum : PKG_CHECKSUM CHECKSUM")
     def p_pkg_checksum(self, p):
         if not self.check_that_current_element_matches_class_for_value(Package, p.lineno(1)):
             return
         checksum = parse_checksum(p[2])
-        self.current_element.setdefault("checksums", []).append(checksum)
+        self.current_element["checksums"].append(checksum)
 
     @grammar_rule("verification_code : PKG_VERIFICATION_CODE LINE")
     def p_pkg_verification_code(self, p):
@@ -405,10 +428,9 @@ class Parser:
         if "verification_code" in self.current_element:
             self.current_element["logger"].append(f"Multiple values for {p[1]} found. Line: {p.lineno(1)}")
             return
-        verif_code_regex = re.compile(r"([0-9a-f]{40})\s*(\(excludes:\s*(.+)\))?", re.UNICODE)
         verif_code_code_grp = 1
         verif_code_exc_files_grp = 3
-        match = verif_code_regex.match(p[2])
+        match = VERIFICATION_CODE_REGEX.match(p[2])
         if not match:
             self.current_element["logger"].append(
                 f"Error while parsing {p[1]}: Value did not match expected format. Line: {p.lineno(1)}"
@@ -422,17 +444,13 @@ class Parser:
 
     @grammar_rule("files_analyzed : PKG_FILES_ANALYZED LINE")
     def p_pkg_files_analyzed(self, p):
-        if not self.check_that_current_element_matches_class_for_value(Package, p.lineno(1)):
-            return
-        if "files_analyzed" in self.current_element:
-            self.current_element["logger"].append(f"Multiple values for {p[1]} found. Line: {p.lineno(1)}")
-            return
-        self.current_element["files_analyzed"] = p[2] in ["true", "True"]
+        if self.check_that_current_element_matches_class_for_value(Package, p.lineno(1)):
+            set_value(p, self.current_element, method_to_apply=FILES_ANALYZED_VALUES.__getitem__)
 
     @grammar_rule("primary_package_purpose : PRIMARY_PACKAGE_PURPOSE LINE")
     def p_primary_package_purpose(self, p):
         if self.check_that_current_element_matches_class_for_value(Package, p.lineno(1)):
-            set_value(p, self.current_element, method_to_apply=lambda x: PackagePurpose[x.replace("-", "_")])
+            set_value(p, self.current_element, method_to_apply=PACKAGE_PURPOSES.__getitem__)
 
     @grammar_rule(
         "built_date : BUILT_DATE ISO8601_DATE\n release_date : RELEASE_DATE ISO8601_DATE\n "
@@ -444,16 +462,6 @@ class Parser:
 
     # parsing methods for snippet
 
-    @grammar_rule("snippet_attribution_text : SNIPPET_ATTRIBUTION_TEXT text_or_line")
-    def p_snippet_attribution_text(self, p):
-        if self.check_that_current_element_matches_class_for_value(Snippet, p.lineno(1)):
-            self.current_element.setdefault("attribution_texts", []).append(p[2])
-
-    @grammar_rule("snippet_license_info : SNIPPET_LICENSE_INFO license_or_no_assertion_or_none")
-    def p_snippet_license_info(self, p):
-        if self.check_that_current_element_matches_class_for_value(Snippet, p.lineno(1)):
-            self.current_element.setdefault("license_info_in_snippet", []).append(p[2])
-
     @grammar_rule("snippet_byte_range : SNIPPET_BYTE_RANGE LINE\n snippet_line_range : SNIPPET_LINE_RANGE LINE")
     def p_snippet_range(self, p):
         if not self.check_that_current_element_matches_class_for_value(Snippet, p.lineno(1)):
@@ -463,14 +471,14 @@ class Parser:
         if argument_name in self.current_element:
             self.current_element["logger"].append(f"Multiple values for {p[1]} found. Line: {p.lineno(1)}")
             return
-        range_re = re.compile(r"^(\d+):(\d+)$", re.UNICODE)
-        if not range_re.match(p[2].strip()):
+        range_match = SNIPPET_RANGE_REGEX.match(p[2].strip())
+        if not range_match:
             self.current_element["logger"].append(
                 f"Value for {p[1]} doesn't match valid range pattern. " f"Line: {p.lineno(1)}"
             )
             return
-        startpoint = int(p[2].split(":")[0])
-        endpoint = int(p[2].split(":")[-1])
+        startpoint = int(range_match.group(1))
+        endpoint = int(range_match.group(2))
         self.current_element[argument_name] = startpoint, endpoint
 
     # parsing methods for annotation
@@ -488,31 +496,30 @@ class Parser:
     @grammar_rule("annotation_type : ANNOTATION_TYPE LINE")
     def p_annotation_type(self, p):
         if self.check_that_current_element_matches_class_for_value(Annotation, p.lineno(1)):
-            set_value(p, self.current_element, method_to_apply=lambda x: AnnotationType[x])
+            set_value(p, self.current_element, method_to_apply=ANNOTATION_TYPES.__getitem__)
 
     # parsing methods for relationship
 
     @grammar_rule("relationship : RELATIONSHIP LINE RELATIONSHIP_COMMENT text_or_line\n " "| RELATIONSHIP LINE")
     def p_relationship(self, p):
         self.initialize_new_current_element(Relationship)
-        try:
-            spdx_element_id, relationship_type, related_spdx_element_id = p[2].split(" ")
-        except ValueError:
+        spdx_element_id, _, relationship_type_and_related_element_id = p[2].partition(" ")
+        relationship_type, separator, related_spdx_element_id = relationship_type_and_related_element_id.partition(" ")
+        if not separator or " " in related_spdx_element_id:
             self.current_element["logger"].append(
                 f"Relationship couldn't be split in spdx_element_id, relationship_type and "
                 f"related_spdx_element. Line: {p.lineno(1)}"
             )
             return
-        try:
-            self.current_element["relationship_type"] = RelationshipType[relationship_type]
-        except KeyError:
+        if relationship_type in RELATIONSHIP_TYPES:
+            self.current_element["relationship_type"] = RELATIONSHIP_TYPES[relationship_type]
+        else:
             self.current_element["logger"].append(f"Invalid RelationshipType {relationship_type}. Line: {p.lineno(1)}")
-        if related_spdx_element_id == "NONE":
-            related_spdx_element_id = SpdxNone()
-        if related_spdx_element_id == "NOASSERTION":
-            related_spdx_element_id = SpdxNoAssertion()
-        self.current_element["related_spdx_element_id"] = related_spdx_element_id
-        self.current_element["spdx_element_id"] = spdx_element_id
+        if related_spdx_element_id in SPDX_SENTINELS:
+            self.current_element["related_spdx_element_id"] = SPDX_SENTINELS[related_spdx_element_id]
+        else:
+            self.current_element["related_spdx_element_id"] = sys.intern(related_spdx_element_id)
+        self.current_element["spdx_element_id"] = sys.intern(spdx_element_id)
         if len(p) == 5:
             self.current_element["comment"] = p[4]
 
@@ -543,14 +550,12 @@ class Parser:
     def initialize_new_current_element(self, clazz: Any):
         self.construct_current_element()
         self.current_element["class"] = clazz
+        for field_name in ELEMENT_LIST_FIELDS.get(clazz, []):
+            self.current_element[field_name] = []
 
     def check_that_current_element_matches_class_for_value(self, expected_class, line_number) -> bool:
-        if "class" not in self.current_element or expected_class != self.current_element["class"]:
-            self.logger.append(
-                f"Element {expected_class.__name__} is not the current element in scope, probably the expected tag to "
-                f"start the element ({ELEMENT_EXPECTED_START_TAG[expected_class.__name__]}) is missing. "
-                f"Line: {line_number}"
-            )
+        if self.current_element.get("class") is not expected_class:
+            self.logger.append(f"{ELEMENT_NOT_IN_SCOPE_MESSAGE[expected_class]}Line: {line_number}")
             return False
         return True
 
@@ -563,9 +568,13 @@ class Parser:
         clazz = self.current_element.pop("class")
         try:
             raise_parsing_error_if_logger_has_messages(self.current_element.pop("logger"), clazz.__name__)
-            self.elements_built.setdefault(CLASS_MAPPING[clazz.__name__], []).append(
-                construct_or_raise_parsing_error(clazz, self.current_element)
-            )
+            # the list is added even if the element can't be constructed, files use this to tell a package that
+            # wasn't parsed successfully from a missing package
+            elements = self.elements_built.setdefault(CLASS_MAPPING[clazz], [])
+            element = construct_or_raise_parsing_error(clazz, self.current_element)
+            elements.append(element)
+            if clazz == Relationship:
+                self.relationship_keys.add(get_full_relationship_key(element))
             if clazz == File:
                 self.check_for_preceding_package_and_build_contains_relationship()
         except SPDXParsingError as err:
@@ -587,6 +596,37 @@ class Parser:
             )
             return
         package_spdx_id = self.elements_built["packages"][-1].spdx_id
-        relationship = Relationship(package_spdx_id, RelationshipType.CONTAINS, file_spdx_id)
-        if relationship not in self.elements_built.setdefault("relationships", []):
-            self.elements_built["relationships"].append(relationship)
+        relationship_key = (package_spdx_id, RelationshipType.CONTAINS, file_spdx_id, None)
+        if relationship_key not in self.relationship_keys:
+            self.relationship_keys.add(relationship_key)
+            self.elements_built.setdefault("relationships", []).append(
+                Relationship(package_spdx_id, RelationshipType.CONTAINS, file_spdx_id)
+            )
+
+
+def get_full_relationship_key(relationship: Relationship) -> Tuple:
+    # covers all fields, so that two relationships have the same key exactly if they are equal; unlike
+    # RelationshipParser.get_relationship_key, the comment is part of the key, as tag-value only skips exact duplicates
+    return (
+        relationship.spdx_element_id,
+        relationship.relationship_type,
+        relationship.related_spdx_element_id,
+        relationship.comment,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_cached_spdx_licensing() -> Licensing:
+    # building the licensing object loads the whole license index, which is far too slow to be done for every license
+    return get_spdx_licensing()
+
+
+@lru_cache(maxsize=8192)
+def parse_license_expression(license_expression: str) -> LicenseExpression:
+    # the same license expressions tend to be repeated for many files and packages of a document
+    spdx_licensing = get_cached_spdx_licensing()
+    # most values are a single license id, for a known key the full parse would return exactly this symbol
+    license_symbol = spdx_licensing.known_symbols.get(license_expression)
+    if license_symbol is not None:
+        return license_symbol
+    return spdx_licensing.parse(license_expression)
@@ -0,0 +1,262 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ANNOTATION_COMMENT ANNOTATION_DATE ANNOTATION_SPDX_ID ANNOTATION_TYPE ANNOTATOR BUILT_DATE CHECKSUM CREATED CREATOR CREATOR_COMMENT DOC_COMMENT DOC_LICENSE DOC_NAME DOC_NAMESPACE DOC_VERSION EXT_DOC_REF FILE_ATTRIBUTION_TEXT FILE_CHECKSUM FILE_COMMENT FILE_CONTRIBUTOR FILE_COPYRIGHT_TEXT FILE_LICENSE_COMMENT FILE_LICENSE_CONCLUDED FILE_LICENSE_INFO FILE_NAME FILE_NOTICE FILE_TYPE ISO8601_DATE LICENSE_COMMENT LICENSE_CROSS_REF LICENSE_ID LICENSE_LIST_VERSION LICENSE_NAME LICENSE_TEXT LINE NONE NO_ASSERTION ORGANIZATION_VALUE PERSON_VALUE PKG_ATTRIBUTION_TEXT PKG_CHECKSUM PKG_COMMENT PKG_COPYRIGHT_TEXT PKG_DESCRIPTION PKG_DOWNLOAD_LOCATION PKG_EXTERNAL_REF PKG_EXTERNAL_REF_COMMENT PKG_FILES_ANALYZED PKG_FILE_NAME PKG_HOMEPAGE PKG_LICENSE_COMMENT PKG_LICENSE_CONCLUDED PKG_LICENSE_DECLARED PKG_LICENSE_INFO PKG_NAME PKG_ORIGINATOR PKG_SOURCE_INFO PKG_SUMMARY PKG_SUPPLIER PKG_VERIFICATION_CODE PKG_VERSION PRIMARY_PACKAGE_PURPOSE RELATIONSHIP RELATIONSHIP_COMMENT RELEASE_DATE SNIPPET_ATTRIBUTION_TEXT SNIPPET_BYTE_RANGE SNIPPET_COMMENT SNIPPET_COPYRIGHT_TEXT SNIPPET_FILE_SPDXID SNIPPET_LICENSE_COMMENT SNIPPET_LICENSE_CONCLUDED SNIPPET_LICENSE_INFO SNIPPET_LINE_RANGE SNIPPET_NAME SNIPPET_SPDX_ID SPDX_ID TEXT TOOL_VALUE UNKNOWN_TAG VALID_UNTIL_DATEstart : start attrib start : attrib attrib : spdx_version\n| spdx_id\n| data_license\n| doc_name\n| document_comment\n| document_namespace\n| creator\n| created\n| creator_comment\n| license_list_version\n| ext_doc_ref\n| file_name\n| file_type\n| file_checksum\n| file_license_concluded\n| file_license_info\n| file_copyright_text\n| file_license_comment\n| file_attribution_text\n| file_notice\n| file_comment\n| file_contributor\n| annotator\n| annotation_date\n| annotation_comment\n| annotation_type\n| annotation_spdx_id\n| relationship\n| snippet_spdx_id\n| snippet_name\n| snippet_comment\n| snippet_attribution_text\n| snippet_copyright_text\n| snippet_license_comment\n| file_spdx_id\n| snippet_license_concluded\n| snippet_license_info\n| snippet_byte_range\n| snippet_line_range\n| package_name\n| package_version\n| download_location\n| files_analyzed\n| homepage\n| summary\n| source_info\n| pkg_file_name\n| supplier\n| originator\n| pkg_checksum\n| verification_code\n| description\n| pkg_comment\n| pkg_attribution_text\n| pkg_license_declared\n| pkg_license_concluded\n| pkg_license_info\n| pkg_license_comment\n| pkg_copyright_text\n| pkg_external_ref\n| primary_package_purpose\n| built_date\n| release_date\n| valid_until_date\n| license_id\n| extracted_text\n| license_name\n| license_cross_ref\n| lic_comment\n| unknown_tag license_id : LICENSE_ID error\n license_cross_ref : LICENSE_CROSS_REF error\n lic_comment : LICENSE_COMMENT error\n license_name : LICENSE_NAME error\n extracted_text : LICENSE_TEXT error\n file_name : FILE_NAME error\n file_contributor : FILE_CONTRIBUTOR error\n file_notice : FILE_NOTICE error\n file_copyright_text : FILE_COPYRIGHT_TEXT error\n file_license_comment : FILE_LICENSE_COMMENT error\n file_license_info : FILE_LICENSE_INFO error\n file_comment : FILE_COMMENT error\n file_checksum : FILE_CHECKSUM error\n file_license_concluded : FILE_LICENSE_CONCLUDED error\n file_type : FILE_TYPE error\n file_attribution_text : FILE_ATTRIBUTION_TEXT error\n package_name : PKG_NAME error\n pkg_attribution_text : PKG_ATTRIBUTION_TEXT error\n description : PKG_DESCRIPTION error\n pkg_comment : PKG_COMMENT error\n summary : PKG_SUMMARY error\n pkg_copyright_text : PKG_COPYRIGHT_TEXT error\n pkg_external_ref : PKG_EXTERNAL_REF error\n pkg_license_comment : PKG_LICENSE_COMMENT error\n pkg_license_declared : PKG_LICENSE_DECLARED error\n pkg_license_info : PKG_LICENSE_INFO error \n pkg_license_concluded : PKG_LICENSE_CONCLUDED error\n source_info : PKG_SOURCE_INFO error\n homepage : PKG_HOMEPAGE error\n pkg_checksum : PKG_CHECKSUM error\n verification_code : PKG_VERIFICATION_CODE error\n originator : PKG_ORIGINATOR error\n download_location : PKG_DOWNLOAD_LOCATION error\n files_analyzed : PKG_FILES_ANALYZED error\n supplier : PKG_SUPPLIER error\n pkg_file_name : PKG_FILE_NAME error\n package_version : PKG_VERSION error\n primary_package_purpose : PRIMARY_PACKAGE_PURPOSE error\n built_date : BUILT_DATE error\n release_date : RELEASE_DATE error\n valid_until_date : VALID_UNTIL_DATE error\n snippet_spdx_id : SNIPPET_SPDX_ID error\n snippet_name : SNIPPET_NAME error\n snippet_comment : SNIPPET_COMMENT error\n snippet_attribution_text : SNIPPET_ATTRIBUTION_TEXT error\n snippet_copyright_text : SNIPPET_COPYRIGHT_TEXT error\n snippet_license_comment : SNIPPET_LICENSE_COMMENT error\n file_spdx_id : SNIPPET_FILE_SPDXID error\n snippet_license_concluded : SNIPPET_LICENSE_CONCLUDED error\n snippet_license_info : SNIPPET_LICENSE_INFO error\n snippet_byte_range : SNIPPET_BYTE_RANGE error\n snippet_line_range : SNIPPET_LINE_RANGE error\n annotator : ANNOTATOR error\n annotation_date : ANNOTATION_DATE error\n annotation_comment : ANNOTATION_COMMENT error\n annotation_type : ANNOTATION_TYPE error\n annotation_spdx_id : ANNOTATION_SPDX_ID error\n relationship : RELATIONSHIP errorlicense_name : LICENSE_NAME line_or_no_assertion\n extracted_text : LICENSE_TEXT text_or_line\n lic_comment : LICENSE_COMMENT text_or_line\n license_id : LICENSE_ID LINE\n file_name : FILE_NAME LINE \n file_notice : FILE_NOTICE text_or_line\n file_copyright_text : FILE_COPYRIGHT_TEXT line_or_no_assertion_or_none\n file_license_comment : FILE_LICENSE_COMMENT text_or_line\n file_comment : FILE_COMMENT text_or_line\n file_license_concluded : FILE_LICENSE_CONCLUDED license_or_no_assertion_or_none\n package_name : PKG_NAME LINE\n description : PKG_DESCRIPTION text_or_line\n summary : PKG_SUMMARY text_or_line\n source_info : PKG_SOURCE_INFO text_or_line\n homepage : PKG_HOMEPAGE line_or_no_assertion_or_none\n download_location : PKG_DOWNLOAD_LOCATION line_or_no_assertion_or_none\n originator : PKG_ORIGINATOR actor_or_no_assertion\n supplier : PKG_SUPPLIER actor_or_no_assertion\n pkg_comment : PKG_COMMENT text_or_line\n pkg_copyright_text : PKG_COPYRIGHT_TEXT line_or_no_assertion_or_none\n pkg_license_declared : PKG_LICENSE_DECLARED license_or_no_assertion_or_none\n pkg_file_name : PKG_FILE_NAME LINE\n pkg_license_concluded : PKG_LICENSE_CONCLUDED license_or_no_assertion_or_none\n package_version : PKG_VERSION LINE\n pkg_license_comment : PKG_LICENSE_COMMENT text_or_line\n snippet_spdx_id : SNIPPET_SPDX_ID LINE\n snippet_name : SNIPPET_NAME LINE\n snippet_comment : SNIPPET_COMMENT text_or_line\n snippet_copyright_text : SNIPPET_COPYRIGHT_TEXT line_or_no_assertion_or_none\n snippet_license_comment : SNIPPET_LICENSE_COMMENT text_or_line\n file_spdx_id : SNIPPET_FILE_SPDXID LINE\n snippet_license_concluded : SNIPPET_LICENSE_CONCLUDED license_or_no_assertion_or_none\n annotation_spdx_id : ANNOTATION_SPDX_ID LINE\n annotation_comment : ANNOTATION_COMMENT text_or_linelicense_cross_ref : LICENSE_CROSS_REF LINE\n file_contributor : FILE_CONTRIBUTOR LINE\n file_attribution_text : FILE_ATTRIBUTION_TEXT text_or_line\n file_license_info : FILE_LICENSE_INFO license_or_no_assertion_or_none\n pkg_attribution_text : PKG_ATTRIBUTION_TEXT text_or_line\n pkg_license_info : PKG_LICENSE_INFO license_or_no_assertion_or_none\n snippet_attribution_text : SNIPPET_ATTRIBUTION_TEXT text_or_line\n snippet_license_info : SNIPPET_LICENSE_INFO license_or_no_assertion_or_noneunknown_tag : UNKNOWN_TAG text_or_line\n | UNKNOWN_TAG ISO8601_DATE\n | UNKNOWN_TAG PERSON_VALUE \n| UNKNOWN_TAGtext_or_line : TEXTtext_or_line : LINE\n line_or_no_assertion : LINE\nline_or_no_assertion_or_none : text_or_linelicense_or_no_assertion_or_none : NO_ASSERTION\n actor_or_no_assertion : NO_ASSERTION\nline_or_no_assertion : NO_ASSERTION\n line_or_no_assertion_or_none : NO_ASSERTIONlicense_or_no_assertion_or_none : NONE\n line_or_no_assertion_or_none : NONElicense_or_no_assertion_or_none : LINEactor_or_no_assertion : PERSON_VALUE\n | ORGANIZATION_VALUEspdx_id : SPDX_ID LINElicense_list_version : LICENSE_LIST_VERSION error\n document_comment : DOC_COMMENT error\n document_namespace : DOC_NAMESPACE error\n data_license : DOC_LICENSE error\n doc_name : DOC_NAME error\n ext_doc_ref : EXT_DOC_REF error\n spdx_version : DOC_VERSION error\n creator_comment : CREATOR_COMMENT error\n creator : CREATOR error\n created : CREATED errordocument_comment : DOC_COMMENT text_or_line\n document_namespace : DOC_NAMESPACE LINE\n data_license : DOC_LICENSE LINE\n spdx_version : DOC_VERSION LINE\n creator_comment : CREATOR_COMMENT text_or_line\n doc_name : DOC_NAME LINElicense_list_version : LICENSE_LIST_VERSION LINEext_doc_ref : EXT_DOC_REF LINEcreator : CREATOR PERSON_VALUE\n| CREATOR TOOL_VALUE\n| CREATOR ORGANIZATION_VALUEcreated : CREATED ISO8601_DATEfile_type : FILE_TYPE LINEfile_checksum : FILE_CHECKSUM CHECKSUMpkg_external_ref : PKG_EXTERNAL_REF LINE PKG_EXTERNAL_REF_COMMENT text_or_line\n | PKG_EXTERNAL_REF LINEpkg_checksum : PKG_CHECKSUM CHECKSUMverification_code : PKG_VERIFICATION_CODE LINEfiles_analyzed : PKG_FILES_ANALYZED LINEprimary_package_purpose : PRIMARY_PACKAGE_PURPOSE LINEbuilt_date : BUILT_DATE ISO8601_DATE\n release_date : RELEASE_DATE ISO8601_DATE\n valid_until_date : VALID_UNTIL_DATE ISO8601_DATEsnippet_byte_range : SNIPPET_BYTE_RANGE LINE\n snippet_line_range : SNIPPET_LINE_RANGE LINEannotator : ANNOTATOR PERSON_VALUE\n| TOOL_VALUE\n| ORGANIZATION_VALUEannotation_date : ANNOTATION_DATE ISO8601_DATEannotation_type : ANNOTATION_TYPE LINErelationship : RELATIONSHIP LINE RELATIONSHIP_COMMENT text_or_line\n | RELATIONSHIP LINE'
+    
+_lr_action_items = {'DOC_VERSION':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[73,73,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SPDX_ID':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[74,74,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'DOC_LICENSE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[75,75,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'DOC_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[76,76,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'DOC_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[77,77,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'DOC_NAMESPACE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[78,78,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'CREATOR':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[79,79,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'CREATED':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[82,82,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'CREATOR_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[83,83,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'LICENSE_LIST_VERSION':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[84,84,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'EXT_DOC_REF':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[85,85,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[86,86,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_TYPE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[87,87,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_CHECKSUM':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[88,88,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_LICENSE_CONCLUDED':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[89,89,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_LICENSE_INFO':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[90,90,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_COPYRIGHT_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[91,91,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_LICENSE_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[92,92,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_ATTRIBUTION_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[93,93,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_NOTICE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[94,94,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[95,95,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'FILE_CONTRIBUTOR':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[96,96,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'ANNOTATOR':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[97,97,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'TOOL_VALUE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,79,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[80,80,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,161,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'ORGANIZATION_VALUE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,79,80,81,122,123,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[81,81,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,162,-227,-228,253,253,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'ANNOTATION_DATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[98,98,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'ANNOTATION_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[99,99,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'ANNOTATION_TYPE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[100,100,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'ANNOTATION_SPDX_ID':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[101,101,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'RELATIONSHIP':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[102,102,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_SPDX_ID':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[103,103,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[104,104,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[105,105,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_ATTRIBUTION_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[106,106,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_COPYRIGHT_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[107,107,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_LICENSE_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[108,108,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_FILE_SPDXID':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[109,109,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_LICENSE_CONCLUDED':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[110,110,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_LICENSE_INFO':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[111,111,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_BYTE_RANGE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[112,112,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'SNIPPET_LINE_RANGE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[113,113,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[114,114,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_VERSION':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[115,115,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_DOWNLOAD_LOCATION':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[116,116,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_FILES_ANALYZED':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[117,117,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_HOMEPAGE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[118,118,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_SUMMARY':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[119,119,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_SOURCE_INFO':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[120,120,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_FILE_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[121,121,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_SUPPLIER':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[122,122,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_ORIGINATOR':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[123,123,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_CHECKSUM':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[124,124,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_VERIFICATION_CODE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[125,125,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_DESCRIPTION':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[126,126,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[127,127,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_ATTRIBUTION_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[128,128,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_LICENSE_DECLARED':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[129,129,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_LICENSE_CONCLUDED':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[130,130,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_LICENSE_INFO':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[131,131,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_LICENSE_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[132,132,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_COPYRIGHT_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[133,133,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PKG_EXTERNAL_REF':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[134,134,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'PRIMARY_PACKAGE_PURPOSE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[135,135,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'BUILT_DATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[136,136,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'RELEASE_DATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[137,137,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'VALID_UNTIL_DATE':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[138,138,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'LICENSE_ID':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[139,139,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'LICENSE_TEXT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[140,140,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'LICENSE_NAME':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[141,141,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'LICENSE_CROSS_REF':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[142,142,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'LICENSE_COMMENT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[143,143,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'UNKNOWN_TAG':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[144,144,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,80,81,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,303,304,],[0,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-227,-228,-176,-1,-197,-204,-190,-194,-203,-195,-206,-192,-201,-177,-178,-193,-202,-199,-209,-210,-211,-200,-212,-198,-205,-191,-207,-196,-208,-78,-135,-87,-213,-85,-214,-86,-140,-181,-185,-187,-83,-168,-81,-137,-180,-184,-186,-82,-138,-88,-167,-80,-136,-84,-139,-79,-166,-125,-226,-126,-229,-127,-164,-128,-230,-129,-163,-130,-232,-114,-156,-115,-157,-116,-158,-117,-171,-118,-159,-119,-160,-120,-161,-121,-162,-122,-172,-123,-224,-124,-225,-89,-141,-109,-154,-105,-146,-106,-219,-101,-145,-93,-143,-100,-144,-108,-152,-107,-148,-182,-188,-189,-104,-147,-102,-217,-103,-218,-91,-142,-92,-149,-90,-169,-97,-151,-99,-153,-98,-170,-96,-155,-94,-150,-95,-216,-110,-220,-111,-221,-112,-222,-113,-223,-73,-134,-77,-132,-76,-131,-179,-183,-74,-165,-75,-133,-173,-174,-175,-231,-215,]),'error':([73,75,76,77,78,79,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,],[146,149,151,153,157,159,163,165,167,169,171,173,175,177,182,184,189,191,193,195,197,199,201,203,205,207,209,211,213,215,217,219,221,223,225,227,229,231,233,235,237,239,241,243,245,247,249,254,256,258,260,262,264,266,268,270,272,274,276,278,280,282,284,286,288,290,294,296,]),'LINE':([73,74,75,76,77,78,83,84,85,86,87,89,90,91,92,93,94,95,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,125,126,127,128,129,130,131,132,133,134,135,139,140,141,142,143,144,301,302,],[147,148,150,152,156,158,156,168,170,172,174,181,181,156,156,156,156,156,198,156,206,208,210,212,214,156,156,156,156,224,181,181,230,232,234,236,156,240,156,156,156,248,259,156,156,156,181,181,181,156,156,277,279,287,156,292,295,156,156,156,156,]),'TEXT':([77,83,91,92,93,94,95,99,105,106,107,108,116,118,119,120,126,127,128,132,133,140,143,144,301,302,],[155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,]),'PERSON_VALUE':([79,97,122,123,144,],[160,200,252,252,300,]),'ISO8601_DATE':([82,98,136,137,138,144,],[164,202,281,283,285,299,]),'CHECKSUM':([88,124,],[176,257,]),'NO_ASSERTION':([89,90,91,107,110,111,116,118,122,123,129,130,131,133,141,],[179,179,187,187,179,179,187,187,251,251,179,179,179,187,293,]),'NONE':([89,90,91,107,110,111,116,118,129,130,131,133,],[180,180,188,188,180,180,188,188,180,180,180,188,]),'RELATIONSHIP_COMMENT':([210,],[301,]),'PKG_EXTERNAL_REF_COMMENT':([277,],[302,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'attrib':([0,1,],[2,145,]),'spdx_version':([0,1,],[3,3,]),'spdx_id':([0,1,],[4,4,]),'data_license':([0,1,],[5,5,]),'doc_name':([0,1,],[6,6,]),'document_comment':([0,1,],[7,7,]),'document_namespace':([0,1,],[8,8,]),'creator':([0,1,],[9,9,]),'created':([0,1,],[10,10,]),'creator_comment':([0,1,],[11,11,]),'license_list_version':([0,1,],[12,12,]),'ext_doc_ref':([0,1,],[13,13,]),'file_name':([0,1,],[14,14,]),'file_type':([0,1,],[15,15,]),'file_checksum':([0,1,],[16,16,]),'file_license_concluded':([0,1,],[17,17,]),'file_license_info':([0,1,],[18,18,]),'file_copyright_text':([0,1,],[19,19,]),'file_license_comment':([0,1,],[20,20,]),'file_attribution_text':([0,1,],[21,21,]),'file_notice':([0,1,],[22,22,]),'file_comment':([0,1,],[23,23,]),'file_contributor':([0,1,],[24,24,]),'annotator':([0,1,],[25,25,]),'annotation_date':([0,1,],[26,26,]),'annotation_comment':([0,1,],[27,27,]),'annotation_type':([0,1,],[28,28,]),'annotation_spdx_id':([0,1,],[29,29,]),'relationship':([0,1,],[30,30,]),'snippet_spdx_id':([0,1,],[31,31,]),'snippet_name':([0,1,],[32,32,]),'snippet_comment':([0,1,],[33,33,]),'snippet_attribution_text':([0,1,],[34,34,]),'snippet_copyright_text':([0,1,],[35,35,]),'snippet_license_comment':([0,1,],[36,36,]),'file_spdx_id':([0,1,],[37,37,]),'snippet_license_concluded':([0,1,],[38,38,]),'snippet_license_info':([0,1,],[39,39,]),'snippet_byte_range':([0,1,],[40,40,]),'snippet_line_range':([0,1,],[41,41,]),'package_name':([0,1,],[42,42,]),'package_version':([0,1,],[43,43,]),'download_location':([0,1,],[44,44,]),'files_analyzed':([0,1,],[45,45,]),'homepage':([0,1,],[46,46,]),'summary':([0,1,],[47,47,]),'source_info':([0,1,],[48,48,]),'pkg_file_name':([0,1,],[49,49,]),'supplier':([0,1,],[50,50,]),'originator':([0,1,],[51,51,]),'pkg_checksum':([0,1,],[52,52,]),'verification_code':([0,1,],[53,53,]),'description':([0,1,],[54,54,]),'pkg_comment':([0,1,],[55,55,]),'pkg_attribution_text':([0,1,],[56,56,]),'pkg_license_declared':([0,1,],[57,57,]),'pkg_license_concluded':([0,1,],[58,58,]),'pkg_license_info':([0,1,],[59,59,]),'pkg_license_comment':([0,1,],[60,60,]),'pkg_copyright_text':([0,1,],[61,61,]),'pkg_external_ref':([0,1,],[62,62,]),'primary_package_purpose':([0,1,],[63,63,]),'built_date':([0,1,],[64,64,]),'release_date':([0,1,],[65,65,]),'valid_until_date':([0,1,],[66,66,]),'license_id':([0,1,],[67,67,]),'extracted_text':([0,1,],[68,68,]),'license_name':([0,1,],[69,69,]),'license_cross_ref':([0,1,],[70,70,]),'lic_comment':([0,1,],[71,71,]),'unknown_tag':([0,1,],[72,72,]),'text_or_line':([77,83,91,92,93,94,95,99,105,106,107,108,116,118,119,120,126,127,128,132,133,140,143,144,301,302,],[154,166,186,190,192,194,196,204,216,218,186,222,186,186,244,246,261,263,265,273,186,289,297,298,303,304,]),'license_or_no_assertion_or_none':([89,90,110,111,129,130,131,],[178,183,226,228,267,269,271,]),'line_or_no_assertion_or_none':([91,107,116,118,133,],[185,220,238,242,275,]),'actor_or_no_assertion':([122,123,],[250,255,]),'line_or_no_assertion':([141,],[291,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> start attrib','start',2,'p_start_start_attrib','parser.py',139),
+  ('start -> attrib','start',1,'p_start_attrib','parser.py',143),
+  ('attrib -> spdx_version','attrib',1,'p_attrib','parser.py',147),
+  ('attrib -> spdx_id','attrib',1,'p_attrib','parser.py',148),
+  ('attrib -> data_license','attrib',1,'p_attrib','parser.py',149),
+  ('attrib -> doc_name','attrib',1,'p_attrib','parser.py',150),
+  ('attrib -> document_comment','attrib',1,'p_attrib','parser.py',151),
+  ('attrib -> document_namespace','attrib',1,'p_attrib','parser.py',152),
+  ('attrib -> creator','attrib',1,'p_attrib','parser.py',153),
+  ('attrib -> created','attrib',1,'p_attrib','parser.py',154),
+  ('attrib -> creator_comment','attrib',1,'p_attrib','parser.py',155),
+  ('attrib -> license_list_version','attrib',1,'p_attrib','parser.py',156),
+  ('attrib -> ext_doc_ref','attrib',1,'p_attrib','parser.py',157),
+  ('attrib -> file_name','attrib',1,'p_attrib','parser.py',158),
+  ('attrib -> file_type','attrib',1,'p_attrib','parser.py',159),
+  ('attrib -> file_checksum','attrib',1,'p_attrib','parser.py',160),
+  ('attrib -> file_license_concluded','attrib',1,'p_attrib','parser.py',161),
+  ('attrib -> file_license_info','attrib',1,'p_attrib','parser.py',162),
+  ('attrib -> file_copyright_text','attrib',1,'p_attrib','parser.py',163),
+  ('attrib -> file_license_comment','attrib',1,'p_attrib','parser.py',164),
+  ('attrib -> file_attribution_text','attrib',1,'p_attrib','parser.py',165),
+  ('attrib -> file_notice','attrib',1,'p_attrib','parser.py',166),
+  ('attrib -> file_comment','attrib',1,'p_attrib','parser.py',167),
+  ('attrib -> file_contributor','attrib',1,'p_attrib','parser.py',168),
+  ('attrib -> annotator','attrib',1,'p_attrib','parser.py',169),
+  ('attrib -> annotation_date','attrib',1,'p_attrib','parser.py',170),
+  ('attrib -> annotation_comment','attrib',1,'p_attrib','parser.py',171),
+  ('attrib -> annotation_type','attrib',1,'p_attrib','parser.py',172),
+  ('attrib -> annotation_spdx_id','attrib',1,'p_attrib','parser.py',173),
+  ('attrib -> relationship','attrib',1,'p_attrib','parser.py',174),
+  ('attrib -> snippet_spdx_id','attrib',1,'p_attrib','parser.py',175),
+  ('attrib -> snippet_name','attrib',1,'p_attrib','parser.py',176),
+  ('attrib -> snippet_comment','attrib',1,'p_attrib','parser.py',177),
+  ('attrib -> snippet_attribution_text','attrib',1,'p_attrib','parser.py',178),
+  ('attrib -> snippet_copyright_text','attrib',1,'p_attrib','parser.py',179),
+  ('attrib -> snippet_license_comment','attrib',1,'p_attrib','parser.py',180),
+  ('attrib -> file_spdx_id','attrib',1,'p_attrib','parser.py',181),
+  ('attrib -> snippet_license_concluded','attrib',1,'p_attrib','parser.py',182),
+  ('attrib -> snippet_license_info','attrib',1,'p_attrib','parser.py',183),
+  ('attrib -> snippet_byte_range','attrib',1,'p_attrib','parser.py',184),
+  ('attrib -> snippet_line_range','attrib',1,'p_attrib','parser.py',185),
+  ('attrib -> package_name','attrib',1,'p_attrib','parser.py',186),
+  ('attrib -> package_version','attrib',1,'p_attrib','parser.py',187),
+  ('attrib -> download_location','attrib',1,'p_attrib','parser.py',188),
+  ('attrib -> files_analyzed','attrib',1,'p_attrib','parser.py',189),
+  ('attrib -> homepage','attrib',1,'p_attrib','parser.py',190),
+  ('attrib -> summary','attrib',1,'p_attrib','parser.py',191),
+  ('attrib -> source_info','attrib',1,'p_attrib','parser.py',192),
+  ('attrib -> pkg_file_name','attrib',1,'p_attrib','parser.py',193),
+  ('attrib -> supplier','attrib',1,'p_attrib','parser.py',194),
+  ('attrib -> originator','attrib',1,'p_attrib','parser.py',195),
+  ('attrib -> pkg_checksum','attrib',1,'p_attrib','parser.py',196),
+  ('attrib -> verification_code','attrib',1,'p_attrib','parser.py',197),
+  ('attrib -> description','attrib',1,'p_attrib','parser.py',198),
+  ('attrib -> pkg_comment','attrib',1,'p_attrib','parser.py',199),
+  ('attrib -> pkg_attribution_text','attrib',1,'p_attrib','parser.py',200),
+  ('attrib -> pkg_license_declared','attrib',1,'p_attrib','parser.py',201),
+  ('attrib -> pkg_license_concluded','attrib',1,'p_attrib','parser.py',202),
+  ('attrib -> pkg_license_info','attrib',1,'p_attrib','parser.py',203),
+  ('attrib -> pkg_license_comment','attrib',1,'p_attrib','parser.py',204),
+  ('attrib -> pkg_copyright_text','attrib',1,'p_attrib','parser.py',205),
+  ('attrib -> pkg_external_ref','attrib',1,'p_attrib','parser.py',206),
+  ('attrib -> primary_package_purpose','attrib',1,'p_attrib','parser.py',207),
+  ('attrib -> built_date','attrib',1,'p_attrib','parser.py',208),
+  ('attrib -> release_date','attrib',1,'p_attrib','parser.py',209),
+  ('attrib -> valid_until_date','attrib',1,'p_attrib','parser.py',210),
+  ('attrib -> license_id','attrib',1,'p_attrib','parser.py',211),
+  ('attrib -> extracted_text','attrib',1,'p_attrib','parser.py',212),
+  ('attrib -> license_name','attrib',1,'p_attrib','parser.py',213),
+  ('attrib -> license_cross_ref','attrib',1,'p_attrib','parser.py',214),
+  ('attrib -> lic_comment','attrib',1,'p_attrib','parser.py',215),
+  ('attrib -> unknown_tag','attrib',1,'p_attrib','parser.py',216),
+  ('license_id -> LICENSE_ID error','license_id',2,'p_current_element_error','parser.py',176),
+  ('license_cross_ref -> LICENSE_CROSS_REF error','license_cross_ref',2,'p_current_element_error','parser.py',177),
+  ('lic_comment -> LICENSE_COMMENT error','lic_comment',2,'p_current_element_error','parser.py',178),
+  ('license_name -> LICENSE_NAME error','license_name',2,'p_current_element_error','parser.py',179),
+  ('extracted_text -> LICENSE_TEXT error','extracted_text',2,'p_current_element_error','parser.py',180),
+  ('file_name -> FILE_NAME error','file_name',2,'p_current_element_error','parser.py',181),
+  ('file_contributor -> FILE_CONTRIBUTOR error','file_contributor',2,'p_current_element_error','parser.py',182),
+  ('file_notice -> FILE_NOTICE error','file_notice',2,'p_current_element_error','parser.py',183),
+  ('file_copyright_text -> FILE_COPYRIGHT_TEXT error','file_copyright_text',2,'p_current_element_error','parser.py',184),
+  ('file_license_comment -> FILE_LICENSE_COMMENT error','file_license_comment',2,'p_current_element_error','parser.py',185),
+  ('file_license_info -> FILE_LICENSE_INFO error','file_license_info',2,'p_current_element_error','parser.py',186),
+  ('file_comment -> FILE_COMMENT error','file_comment',2,'p_current_element_error','parser.py',187),
+  ('file_checksum -> FILE_CHECKSUM error','file_checksum',2,'p_current_element_error','parser.py',188),
+  ('file_license_concluded -> FILE_LICENSE_CONCLUDED error','file_license_concluded',2,'p_current_element_error','parser.py',189),
+  ('file_type -> FILE_TYPE error','file_type',2,'p_current_element_error','parser.py',190),
+  ('file_attribution_text -> FILE_ATTRIBUTION_TEXT error','file_attribution_text',2,'p_current_element_error','parser.py',191),
+  ('package_name -> PKG_NAME error','package_name',2,'p_current_element_error','parser.py',192),
+  ('pkg_attribution_text -> PKG_ATTRIBUTION_TEXT error','pkg_attribution_text',2,'p_current_element_error','parser.py',193),
+  ('description -> PKG_DESCRIPTION error','description',2,'p_current_element_error','parser.py',194),
+  ('pkg_comment -> PKG_COMMENT error','pkg_comment',2,'p_current_element_error','parser.py',195),
+  ('summary -> PKG_SUMMARY error','summary',2,'p_current_element_error','parser.py',196),
+  ('pkg_copyright_text -> PKG_COPYRIGHT_TEXT error','pkg_copyright_text',2,'p_current_element_error','parser.py',197),
+  ('pkg_external_ref -> PKG_EXTERNAL_REF error','pkg_external_ref',2,'p_current_element_error','parser.py',198),
+  ('pkg_license_comment -> PKG_LICENSE_COMMENT error','pkg_license_comment',2,'p_current_element_error','parser.py',199),
+  ('pkg_license_declared -> PKG_LICENSE_DECLARED error','pkg_license_declared',2,'p_current_element_error','parser.py',200),
+  ('pkg_license_info -> PKG_LICENSE_INFO error','pkg_license_info',2,'p_current_element_error','parser.py',201),
+  ('pkg_license_concluded -> PKG_LICENSE_CONCLUDED error','pkg_license_concluded',2,'p_current_element_error','parser.py',202),
+  ('source_info -> PKG_SOURCE_INFO error','source_info',2,'p_current_element_error','parser.py',203),
+  ('homepage -> PKG_HOMEPAGE error','homepage',2,'p_current_element_error','parser.py',204),
+  ('pkg_checksum -> PKG_CHECKSUM error','pkg_checksum',2,'p_current_element_error','parser.py',205),
+  ('verification_code -> PKG_VERIFICATION_CODE error','verification_code',2,'p_current_element_error','parser.py',206),
+  ('originator -> PKG_ORIGINATOR error','originator',2,'p_current_element_error','parser.py',207),
+  ('download_location -> PKG_DOWNLOAD_LOCATION error','download_location',2,'p_current_element_error','parser.py',208),
+  ('files_analyzed -> PKG_FILES_ANALYZED error','files_analyzed',2,'p_current_element_error','parser.py',209),
+  ('supplier -> PKG_SUPPLIER error','supplier',2,'p_current_element_error','parser.py',210),
+  ('pkg_file_name -> PKG_FILE_NAME error','pkg_file_name',2,'p_current_element_error','parser.py',211),
+  ('package_version -> PKG_VERSION error','package_version',2,'p_current_element_error','parser.py',212),
+  ('primary_package_purpose -> PRIMARY_PACKAGE_PURPOSE error','primary_package_purpose',2,'p_current_element_error','parser.py',213),
+  ('built_date -> BUILT_DATE error','built_date',2,'p_current_element_error','parser.py',214),
+  ('release_date -> RELEASE_DATE error','release_date',2,'p_current_element_error','parser.py',215),
+  ('valid_until_date -> VALID_UNTIL_DATE error','valid_until_date',2,'p_current_element_error','parser.py',216),
+  ('snippet_spdx_id -> SNIPPET_SPDX_ID error','snippet_spdx_id',2,'p_current_element_error','parser.py',217),
+  ('snippet_name -> SNIPPET_NAME error','snippet_name',2,'p_current_element_error','parser.py',218),
+  ('snippet_comment -> SNIPPET_COMMENT error','snippet_comment',2,'p_current_element_error','parser.py',219),
+  ('snippet_attribution_text -> SNIPPET_ATTRIBUTION_TEXT error','snippet_attribution_text',2,'p_current_element_error','parser.py',220),
+  ('snippet_copyright_text -> SNIPPET_COPYRIGHT_TEXT error','snippet_copyright_text',2,'p_current_element_error','parser.py',221),
+  ('snippet_license_comment -> SNIPPET_LICENSE_COMMENT error','snippet_license_comment',2,'p_current_element_error','parser.py',222),
+  ('file_spdx_id -> SNIPPET_FILE_SPDXID error','file_spdx_id',2,'p_current_element_error','parser.py',223),
+  ('snippet_license_concluded -> SNIPPET_LICENSE_CONCLUDED error','snippet_license_concluded',2,'p_current_element_error','parser.py',224),
+  ('snippet_license_info -> SNIPPET_LICENSE_INFO error','snippet_license_info',2,'p_current_element_error','parser.py',225),
+  ('snippet_byte_range -> SNIPPET_BYTE_RANGE error','snippet_byte_range',2,'p_current_element_error','parser.py',226),
+  ('snippet_line_range -> SNIPPET_LINE_RANGE error','snippet_line_range',2,'p_current_element_error','parser.py',227),
+  ('annotator -> ANNOTATOR error','annotator',2,'p_current_element_error','parser.py',228),
+  ('annotation_date -> ANNOTATION_DATE error','annotation_date',2,'p_current_element_error','parser.py',229),
+  ('annotation_comment -> ANNOTATION_COMMENT error','annotation_comment',2,'p_current_element_error','parser.py',230),
+  ('annotation_type -> ANNOTATION_TYPE error','annotation_type',2,'p_current_element_error','parser.py',231),
+  ('annotation_spdx_id -> ANNOTATION_SPDX_ID error','annotation_spdx_id',2,'p_current_element_error','parser.py',232),
+  ('relationship -> RELATIONSHIP error','relationship',2,'p_current_element_error','parser.py',233),
+  ('license_name -> LICENSE_NAME line_or_no_assertion','license_name',2,'p_generic_value','parser.py',217),
+  ('extracted_text -> LICENSE_TEXT text_or_line','extracted_text',2,'p_generic_value','parser.py',218),
+  ('lic_comment -> LICENSE_COMMENT text_or_line','lic_comment',2,'p_generic_value','parser.py',219),
+  ('license_id -> LICENSE_ID LINE','license_id',2,'p_generic_value','parser.py',220),
+  ('file_name -> FILE_NAME LINE','file_name',2,'p_generic_value','parser.py',221),
+  ('file_notice -> FILE_NOTICE text_or_line','file_notice',2,'p_generic_value','parser.py',222),
+  ('file_copyright_text -> FILE_COPYRIGHT_TEXT line_or_no_assertion_or_none','file_copyright_text',2,'p_generic_value','parser.py',223),
+  ('file_license_comment -> FILE_LICENSE_COMMENT text_or_line','file_license_comment',2,'p_generic_value','parser.py',224),
+  ('file_comment -> FILE_COMMENT text_or_line','file_comment',2,'p_generic_value','parser.py',225),
+  ('file_license_concluded -> FILE_LICENSE_CONCLUDED license_or_no_assertion_or_none','file_license_concluded',2,'p_generic_value','parser.py',226),
+  ('package_name -> PKG_NAME LINE','package_name',2,'p_generic_value','parser.py',227),
+  ('description -> PKG_DESCRIPTION text_or_line','description',2,'p_generic_value','parser.py',228),
+  ('summary -> PKG_SUMMARY text_or_line','summary',2,'p_generic_value','parser.py',229),
+  ('source_info -> PKG_SOURCE_INFO text_or_line','source_info',2,'p_generic_value','parser.py',230),
+  ('homepage -> PKG_HOMEPAGE line_or_no_assertion_or_none','homepage',2,'p_generic_value','parser.py',231),
+  ('download_location -> PKG_DOWNLOAD_LOCATION line_or_no_assertion_or_none','download_location',2,'p_generic_value','parser.py',232),
+  ('originator -> PKG_ORIGINATOR actor_or_no_assertion','originator',2,'p_generic_value','parser.py',233),
+  ('supplier -> PKG_SUPPLIER actor_or_no_assertion','supplier',2,'p_generic_value','parser.py',234),
+  ('pkg_comment -> PKG_COMMENT text_or_line','pkg_comment',2,'p_generic_value','parser.py',235),
+  ('pkg_copyright_text -> PKG_COPYRIGHT_TEXT line_or_no_assertion_or_none','pkg_copyright_text',2,'p_generic_value','parser.py',236),
+  ('pkg_license_declared -> PKG_LICENSE_DECLARED license_or_no_assertion_or_none','pkg_license_declared',2,'p_generic_value','parser.py',237),
+  ('pkg_file_name -> PKG_FILE_NAME LINE','pkg_file_name',2,'p_generic_value','parser.py',238),
+  ('pkg_license_concluded -> PKG_LICENSE_CONCLUDED license_or_no_assertion_or_none','pkg_license_concluded',2,'p_generic_value','parser.py',239),
+  ('package_version -> PKG_VERSION LINE','package_version',2,'p_generic_value','parser.py',240),
+  ('pkg_license_comment -> PKG_LICENSE_COMMENT text_or_line','pkg_license_comment',2,'p_generic_value','parser.py',241),
+  ('snippet_spdx_id -> SNIPPET_SPDX_ID LINE','snippet_spdx_id',2,'p_generic_value','parser.py',242),
+  ('snippet_name -> SNIPPET_NAME LINE','snippet_name',2,'p_generic_value','parser.py',243),
+  ('snippet_comment -> SNIPPET_COMMENT text_or_line','snippet_comment',2,'p_generic_value','parser.py',244),
+  ('snippet_copyright_text -> SNIPPET_COPYRIGHT_TEXT line_or_no_assertion_or_none','snippet_copyright_text',2,'p_generic_value','parser.py',245),
+  ('snippet_license_comment -> SNIPPET_LICENSE_COMMENT text_or_line','snippet_license_comment',2,'p_generic_value','parser.py',246),
+  ('file_spdx_id -> SNIPPET_FILE_SPDXID LINE','file_spdx_id',2,'p_generic_value','parser.py',247),
+  ('snippet_license_concluded -> SNIPPET_LICENSE_CONCLUDED license_or_no_assertion_or_none','snippet_license_concluded',2,'p_generic_value','parser.py',248),
+  ('annotation_spdx_id -> ANNOTATION_SPDX_ID LINE','annotation_spdx_id',2,'p_generic_value','parser.py',249),
+  ('annotation_comment -> ANNOTATION_COMMENT text_or_line','annotation_comment',2,'p_generic_value','parser.py',250),
+  ('license_cross_ref -> LICENSE_CROSS_REF LINE','license_cross_ref',2,'p_generic_list_value','parser.py',251),
+  ('file_contributor -> FILE_CONTRIBUTOR LINE','file_contributor',2,'p_generic_list_value','parser.py',252),
+  ('file_attribution_text -> FILE_ATTRIBUTION_TEXT text_or_line','file_attribution_text',2,'p_generic_list_value','parser.py',253),
+  ('file_license_info -> FILE_LICENSE_INFO license_or_no_assertion_or_none','file_license_info',2,'p_generic_list_value','parser.py',254),
+  ('pkg_attribution_text -> PKG_ATTRIBUTION_TEXT text_or_line','pkg_attribution_text',2,'p_generic_list_value','parser.py',255),
+  ('pkg_license_info -> PKG_LICENSE_INFO license_or_no_assertion_or_none','pkg_license_info',2,'p_generic_list_value','parser.py',256),
+  ('snippet_attribution_text -> SNIPPET_ATTRIBUTION_TEXT text_or_line','snippet_attribution_text',2,'p_generic_list_value','parser.py',257),
+  ('snippet_license_info -> SNIPPET_LICENSE_INFO license_or_no_assertion_or_none','snippet_license_info',2,'p_generic_list_value','parser.py',258),
+  ('unknown_tag -> UNKNOWN_TAG text_or_line','unknown_tag',2,'p_unknown_tag','parser.py',265),
+  ('unknown_tag -> UNKNOWN_TAG ISO8601_DATE','unknown_tag',2,'p_unknown_tag','parser.py',266),
+  ('unknown_tag -> UNKNOWN_TAG PERSON_VALUE','unknown_tag',2,'p_unknown_tag','parser.py',267),
+  ('unknown_tag -> UNKNOWN_TAG','unknown_tag',1,'p_unknown_tag','parser.py',268),
+  ('text_or_line -> TEXT','text_or_line',1,'p_text','parser.py',272),
+  ('text_or_line -> LINE','text_or_line',1,'p_line','parser.py',276),
+  ('line_or_no_assertion -> LINE','line_or_no_assertion',1,'p_line','parser.py',277),
+  ('line_or_no_assertion_or_none -> text_or_line','line_or_no_assertion_or_none',1,'p_line','parser.py',278),
+  ('license_or_no_assertion_or_none -> NO_ASSERTION','license_or_no_assertion_or_none',1,'p_no_assertion','parser.py',280),
+  ('actor_or_no_assertion -> NO_ASSERTION','actor_or_no_assertion',1,'p_no_assertion','parser.py',281),
+  ('line_or_no_assertion -> NO_ASSERTION','line_or_no_assertion',1,'p_no_assertion','parser.py',282),
+  ('line_or_no_assertion_or_none -> NO_ASSERTION','line_or_no_assertion_or_none',1,'p_no_assertion','parser.py',283),
+  ('license_or_no_assertion_or_none -> NONE','license_or_no_assertion_or_none',1,'p_none','parser.py',287),
+  ('line_or_no_assertion_or_none -> NONE','line_or_no_assertion_or_none',1,'p_none','parser.py',288),
+  ('license_or_no_assertion_or_none -> LINE','license_or_no_assertion_or_none',1,'p_license','parser.py',291),
+  ('actor_or_no_assertion -> PERSON_VALUE','actor_or_no_assertion',1,'p_actor_values','parser.py',295),
+  ('actor_or_no_assertion -> ORGANIZATION_VALUE','actor_or_no_assertion',1,'p_actor_values','parser.py',296),
+  ('spdx_id -> SPDX_ID LINE','spdx_id',2,'p_spdx_id','parser.py',299),
+  ('license_list_version -> LICENSE_LIST_VERSION error','license_list_version',2,'p_creation_info_value_error','parser.py',312),
+  ('document_comment -> DOC_COMMENT error','document_comment',2,'p_creation_info_value_error','parser.py',313),
+  ('document_namespace -> DOC_NAMESPACE error','document_namespace',2,'p_creation_info_value_error','parser.py',314),
+  ('data_license -> DOC_LICENSE error','data_license',2,'p_creation_info_value_error','parser.py',315),
+  ('doc_name -> DOC_NAME error','doc_name',2,'p_creation_info_value_error','parser.py',316),
+  ('ext_doc_ref -> EXT_DOC_REF error','ext_doc_ref',2,'p_creation_info_value_error','parser.py',317),
+  ('spdx_version -> DOC_VERSION error','spdx_version',2,'p_creation_info_value_error','parser.py',318),
+  ('creator_comment -> CREATOR_COMMENT error','creator_comment',2,'p_creation_info_value_error','parser.py',319),
+  ('creator -> CREATOR error','creator',2,'p_creation_info_value_error','parser.py',320),
+  ('created -> CREATED error','created',2,'p_creation_info_value_error','parser.py',321),
+  ('document_comment -> DOC_COMMENT text_or_line','document_comment',2,'p_generic_value_creation_info','parser.py',323),
+  ('document_namespace -> DOC_NAMESPACE LINE','document_namespace',2,'p_generic_value_creation_info','parser.py',324),
+  ('data_license -> DOC_LICENSE LINE','data_license',2,'p_generic_value_creation_info','parser.py',325),
+  ('spdx_version -> DOC_VERSION LINE','spdx_version',2,'p_generic_value_creation_info','parser.py',326),
+  ('creator_comment -> CREATOR_COMMENT text_or_line','creator_comment',2,'p_generic_value_creation_info','parser.py',327),
+  ('doc_name -> DOC_NAME LINE','doc_name',2,'p_generic_value_creation_info','parser.py',328),
+  ('license_list_version -> LICENSE_LIST_VERSION LINE','license_list_version',2,'p_license_list_version','parser.py',331),
+  ('ext_doc_ref -> EXT_DOC_REF LINE','ext_doc_ref',2,'p_external_document_ref','parser.py',335),
+  ('creator -> CREATOR PERSON_VALUE','creator',2,'p_creator','parser.py',356),
+  ('creator -> CREATOR TOOL_VALUE','creator',2,'p_creator','parser.py',357),
+  ('creator -> CREATOR ORGANIZATION_VALUE','creator',2,'p_creator','parser.py',358),
+  ('created -> CREATED ISO8601_DATE','created',2,'p_created','parser.py',360),
+  ('file_type -> FILE_TYPE LINE','file_type',2,'p_file_type','parser.py',366),
+  ('file_checksum -> FILE_CHECKSUM CHECKSUM','file_checksum',2,'p_file_checksum','parser.py',376),
+  ('pkg_external_ref -> PKG_EXTERNAL_REF LINE PKG_EXTERNAL_REF_COMMENT text_or_line','pkg_external_ref',4,'p_pkg_external_refs','parser.py',385),
+  ('pkg_external_ref -> PKG_EXTERNAL_REF LINE','pkg_external_ref',2,'p_pkg_external_refs','parser.py',386),
+  ('pkg_checksum -> PKG_CHECKSUM CHECKSUM','pkg_checksum',2,'p_pkg_checksum','parser.py',417),
+  ('verification_code -> PKG_VERIFICATION_CODE LINE','verification_code',2,'p_pkg_verification_code','parser.py',424),
+  ('files_analyzed -> PKG_FILES_ANALYZED LINE','files_analyzed',2,'p_pkg_files_analyzed','parser.py',446),
+  ('primary_package_purpose -> PRIMARY_PACKAGE_PURPOSE LINE','primary_package_purpose',2,'p_primary_package_purpose','parser.py',451),
+  ('built_date -> BUILT_DATE ISO8601_DATE','built_date',2,'p_package_dates','parser.py',456),
+  ('release_date -> RELEASE_DATE ISO8601_DATE','release_date',2,'p_package_dates','parser.py',457),
+  ('valid_until_date -> VALID_UNTIL_DATE ISO8601_DATE','valid_until_date',2,'p_package_dates','parser.py',458),
+  ('snippet_byte_range -> SNIPPET_BYTE_RANGE LINE','snippet_byte_range',2,'p_snippet_range','parser.py',466),
+  ('snippet_line_range -> SNIPPET_LINE_RANGE LINE','snippet_line_range',2,'p_snippet_range','parser.py',467),
+  ('annotator -> ANNOTATOR PERSON_VALUE','annotator',2,'p_annotator','parser.py',487),
+  ('annotator -> TOOL_VALUE','annotator',1,'p_annotator','parser.py',488),
+  ('annotator -> ORGANIZATION_VALUE','annotator',1,'p_annotator','parser.py',489),
+  ('annotation_date -> ANNOTATION_DATE ISO8601_DATE','annotation_date',2,'p_annotation_date','parser.py',492),
+  ('annotation_type -> ANNOTATION_TYPE LINE','annotation_type',2,'p_annotation_type','parser.py',497),
+  ('relationship -> RELATIONSHIP LINE RELATIONSHIP_COMMENT text_or_line','relationship',4,'p_relationship','parser.py',504),
+  ('relationship -> RELATIONSHIP LINE','relationship',2,'p_relationship','parser.py',505),
+]
@@ -2,14 +2,20 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import yaml
-from beartype.typing import Dict
 
 from spdx_tools.spdx.model import Document
 from spdx_tools.spdx.parser.jsonlikedict.json_like_dict_parser import JsonLikeDictParser
 
+try:
+    # the libyaml based loader is much faster, but only available if PyYAML was built with libyaml
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def parse_from_file(file_name: str) -> Document:
-    with open(file_name) as file:
-        input_doc_as_dict: Dict = yaml.safe_load(file)
+    # the file is passed as bytes so that the loader detects the encoding itself as required by the YAML spec
+    with open(file_name, "rb") as file:
+        input_doc_as_dict: dict = yaml.load(file, Loader=SafeLoader)
 
     return JsonLikeDictParser().parse(input_doc_as_dict)
@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: 2023 spdx contributors
 #
 # SPDX-License-Identifier: Apache-2.0
+from io import StringIO
+
 from beartype.typing import TextIO
 
 from spdx_tools.spdx3.model import (
@@ -61,5 +63,9 @@ MAP_CLASS_TO_WRITE_METHOD = {
 def write_payload(payload: Payload, text_output: TextIO):
     for element in payload.get_full_map().values():
         write_method = MAP_CLASS_TO_WRITE_METHOD[type(element)]
-        write_method(element, text_output)
-        text_output.write("\n")
+        # every element is collected in a buffer first, so that a line buffered output like a terminal gets a single
+        # write per element instead of one per line
+        element_output = StringIO()
+        write_method(element, element_output)
+        element_output.write("\n")
+        text_output.write(element_output.getvalue())
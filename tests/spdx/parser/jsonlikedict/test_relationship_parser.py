@@ -41,6 +41,20 @@ def test_parse_incomplete_relationship():
         relationship_parser.parse_relationship(relationship_dict)
 
 
+def test_parse_relationship_with_invalid_relationship_type():
+    relationship_parser = RelationshipParser()
+    relationship_dict = {
+        "spdxElementId": DOCUMENT_SPDX_ID,
+        "relationshipType": "IS",
+        "relatedSpdxElement": "SPDXRef-Package",
+    }
+
+    with pytest.raises(SPDXParsingError) as err:
+        relationship_parser.parse_relationship(relationship_dict)
+
+    assert err.value.get_messages() == ["Error while parsing Relationship: ['Invalid RelationshipType: IS']"]
+
+
 def test_parse_relationship_type():
     relationship_parser = RelationshipParser()
     relationship_type_str = "DEPENDENCY_OF"
@@ -213,3 +227,155 @@ def test_parse_has_files_without_duplicating_relationships(has_files, existing_r
 
     assert len(relationships) == len(contains_relationships)
     TestCase().assertCountEqual(relationships, contains_relationships)
+
+
+def test_parse_document_describes_with_existing_no_assertion_relationship():
+    relationship_parser = RelationshipParser()
+    document_dict = {
+        "SPDXID": DOCUMENT_SPDX_ID,
+        "documentDescribes": ["SPDXRef-Package"],
+        "relationships": [
+            {
+                "spdxElementId": DOCUMENT_SPDX_ID,
+                "relatedSpdxElement": "NOASSERTION",
+                "relationshipType": "DESCRIBES",
+            },
+        ],
+    }
+
+    relationships = relationship_parser.parse_all_relationships(document_dict)
+
+    TestCase().assertCountEqual(
+        relationships,
+        [
+            Relationship(DOCUMENT_SPDX_ID, RelationshipType.DESCRIBES, SpdxNoAssertion()),
+            Relationship(DOCUMENT_SPDX_ID, RelationshipType.DESCRIBES, "SPDXRef-Package"),
+        ],
+    )
+
+
+@pytest.mark.parametrize("relationship_type_str", ["INVALID_TYPE", ["CONTAINS"], 42])
+def test_parse_invalid_relationship_type(relationship_type_str):
+    relationship_parser = RelationshipParser()
+
+    with pytest.raises(SPDXParsingError):
+        relationship_parser.parse_relationship_type(relationship_type_str)
+
+
+def test_parse_all_relationships_without_duplicating_relationships():
+    relationship_parser = RelationshipParser()
+    document_dict = {
+        "SPDXID": DOCUMENT_SPDX_ID,
+        "documentDescribes": ["SPDXRef-Package"],
+        "packages": [{"SPDXID": "SPDXRef-Package", "hasFiles": ["SPDXRef-File1", "SPDXRef-File2"]}],
+        "relationships": [
+            {
+                "spdxElementId": "SPDXRef-File1",
+                "relatedSpdxElement": "SPDXRef-Package",
+                "relationshipType": "CONTAINED_BY",
+            },
+        ],
+    }
+
+    relationships = relationship_parser.parse_all_relationships(document_dict)
+
+    TestCase().assertCountEqual(
+        relationships,
+        [
+            Relationship("SPDXRef-File1", RelationshipType.CONTAINED_BY, "SPDXRef-Package"),
+            Relationship(DOCUMENT_SPDX_ID, RelationshipType.DESCRIBES, "SPDXRef-Package"),
+            Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File2"),
+        ],
+    )
+
+
+def test_parse_document_describes_with_invalid_document_spdx_id():
+    relationship_parser = RelationshipParser()
+
+    with pytest.raises(SPDXParsingError) as err:
+        relationship_parser.parse_document_describes(
+            doc_spdx_id=None, described_spdx_ids=["SPDXRef-Package", "SPDXRef-File"], existing_relationships=[]
+        )
+
+    assert err.value.get_messages() == [
+        "Error while parsing document describes relationships: ['Invalid SPDXID of document: None']"
+    ]
+
+
+def test_parse_has_files_with_invalid_package_spdx_id():
+    relationship_parser = RelationshipParser()
+    package_dicts = [
+        {"hasFiles": ["SPDXRef-File1", "SPDXRef-File2"]},
+        {"SPDXID": "SPDXRef-Package", "hasFiles": ["SPDXRef-File3"]},
+    ]
+
+    with pytest.raises(SPDXParsingError) as err:
+        relationship_parser.parse_has_files(package_dicts, existing_relationships=[])
+
+    assert err.value.get_messages() == [
+        "Error while parsing package contains relationships: ['Invalid SPDXID of package with hasFiles: None']"
+    ]
+
+
+@pytest.mark.parametrize(
+    "relationship,existing_relationship,exists",
+    [
+        (
+            Relationship("SPDXRef-A", RelationshipType.DEPENDS_ON, "SPDXRef-B"),
+            Relationship("SPDXRef-B", RelationshipType.DEPENDENCY_OF, "SPDXRef-A", comment="comment"),
+            True,
+        ),
+        (
+            Relationship("SPDXRef-A", RelationshipType.AMENDS, "SPDXRef-B"),
+            Relationship("SPDXRef-A", RelationshipType.AMENDS, "SPDXRef-B"),
+            True,
+        ),
+        (
+            Relationship("SPDXRef-A", RelationshipType.AMENDS, "SPDXRef-B"),
+            Relationship("SPDXRef-B", RelationshipType.AMENDS, "SPDXRef-A"),
+            False,
+        ),
+    ],
+)
+def test_check_if_relationship_exists(relationship, existing_relationship, exists):
+    relationship_parser = RelationshipParser()
+    existing_relationship_keys = relationship_parser.get_relationship_keys([existing_relationship])
+
+    assert relationship_parser.check_if_relationship_exists(relationship, [existing_relationship]) == exists
+    assert (
+        relationship_parser.check_if_relationship_key_exists(
+            relationship_parser.get_relationship_key(relationship), existing_relationship_keys
+        )
+        == exists
+    )
+
+
+def test_parse_has_files_of_repeated_package():
+    relationship_parser = RelationshipParser()
+    package_dicts = [
+        {"SPDXID": "SPDXRef-Package", "hasFiles": ["SPDXRef-File1"]},
+        {"SPDXID": "SPDXRef-Package", "hasFiles": ["SPDXRef-File1", "SPDXRef-File2"]},
+    ]
+
+    relationships = relationship_parser.parse_has_files(package_dicts, existing_relationships=[])
+
+    TestCase().assertCountEqual(
+        relationships,
+        [
+            Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File1"),
+            Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File2"),
+        ],
+    )
+
+
+def test_parse_document_describes_with_invalid_described_spdx_ids():
+    relationship_parser = RelationshipParser()
+
+    with pytest.raises(SPDXParsingError) as err:
+        relationship_parser.parse_document_describes(
+            doc_spdx_id=DOCUMENT_SPDX_ID, described_spdx_ids=["SPDXRef-Package", 42], existing_relationships=[]
+        )
+
+    assert err.value.get_messages() == [
+        "Error while parsing document describes relationships: ['Invalid SPDXIDs of described elements: [42]']"
+    ]
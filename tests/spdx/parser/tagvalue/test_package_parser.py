@@ -100,6 +100,10 @@ def test_parse_package():
             "PackageCopyrightText:MultipleCopyright",
             "Error while parsing Package: ['Multiple values for PackageCopyrightText " "found. Line: 3']",
         ),
+        (
+            "PackageName: TestPackage\nFilesAnalyzed: yes",
+            "Error while parsing Package: ['Invalid FilesAnalyzed: yes. Line: 2']",
+        ),
         (
             "PackageName: TestPackage\nExternalRef: reference locator",
             (
@@ -107,6 +111,13 @@ def test_parse_package():
                 'reference_type and locator. Line: 2"]'
             ),
         ),
+        (
+            "PackageName: TestPackage\nExternalRef: category reference locator additional",
+            (
+                "Error while parsing Package: [\"Couldn't split PackageExternalRef in category, "
+                'reference_type and locator. Line: 2"]'
+            ),
+        ),
         (
             "PackageName: TestPackage\nExternalRef: category reference locator",
             "Error while parsing Package: ['Invalid ExternalPackageRefCategory: " "category. Line: 2']",
@@ -54,10 +54,24 @@ def test_parse_relationship(relationship_str, expected_relationship):
                 'spdx_element_id, relationship_type and related_spdx_element. Line: 1"]'
             ],
         ),
+        (
+            "Relationship: spdx_id DESCRIBES other_id additional_id",
+            [
+                "Error while parsing Relationship: [\"Relationship couldn't be split in "
+                'spdx_element_id, relationship_type and related_spdx_element. Line: 1"]'
+            ],
+        ),
         (
             "Relationship: spdx_id IS spdx_id",
             ["Error while parsing Relationship: ['Invalid RelationshipType IS. Line: 1']"],
         ),
+        (
+            "Relationship: Person: Jane Doe",
+            [
+                "Error while parsing Relationship: ['Error while parsing Relationship: Token did not match specified "
+                "grammar rule. Line: 1']"
+            ],
+        ),
     ],
 )
 def test_parse_invalid_relationship(relationship_str, expected_message):
@@ -4,14 +4,33 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+from ply import yacc
 
 from spdx_tools.spdx.constants import DOCUMENT_SPDX_ID
 from spdx_tools.spdx.model import Relationship, RelationshipType
 from spdx_tools.spdx.parser.error import SPDXParsingError
+from spdx_tools.spdx.parser.tagvalue import parsetab
 from spdx_tools.spdx.parser.tagvalue.parser import Parser
 from tests.spdx.parser.tagvalue.test_creation_info_parser import DOCUMENT_STR
 
 
+def test_shipped_parser_tables_match_grammar():
+    parser = Parser()
+    parser_info = yacc.ParserReflect({name: getattr(parser, name) for name in dir(parser)})
+    parser_info.get_all()
+
+    # if this fails, regenerate the tables with dev/generate_tagvalue_parser_tables.py
+    assert parser_info.signature() == parsetab._lr_signature
+    # the productions also record the line of their rule in parser.py, which goes stale when code in parser.py moves
+    shipped_productions = sorted((name, line, rule) for rule, _, _, name, _, line in parsetab._lr_productions[1:])
+    live_productions = sorted(
+        (name, rule_line, f"{prodname} -> {' '.join(syms)}".strip())
+        for line, _, name, doc in parser_info.pfuncs
+        for _, rule_line, prodname, syms in yacc.parse_grammar(doc, "parser.py", line)
+    )
+    assert shipped_productions == live_productions
+
+
 def test_parse_unknown_tag():
     parser = Parser()
     unknown_tag_str = "UnknownTag: This is an example for an unknown tag."
@@ -98,3 +117,57 @@ def test_document_with_mixed_values():
         "Element Package is not the current element in scope, probably the expected "
         "tag to start the element (PackageName) is missing. Line: 4"
     ]
+
+
+def test_document_with_list_value_for_other_element():
+    parser = Parser()
+    document_str = "\n".join(
+        [
+            f"SPDXID:{DOCUMENT_SPDX_ID}",
+            "FileName: File without package",
+            "SPDXID: SPDXRef-File",
+            "PackageAttributionText: <text>Package attribution text</text>",
+            "FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2759",
+        ]
+    )
+
+    with pytest.raises(SPDXParsingError) as err:
+        parser.parse(document_str)
+
+    assert err.value.get_messages() == [
+        "Element Package is not the current element in scope, probably the expected "
+        "tag to start the element (PackageName) is missing. Line: 4"
+    ]
+
+
+def test_building_contains_relationship_already_given():
+    parser = Parser()
+    document_str = "\n".join(
+        [
+            DOCUMENT_STR,
+            "PackageName: Package with file",
+            "SPDXID: SPDXRef-Package",
+            "PackageDownloadLocation: https://download.com",
+            "Relationship: SPDXRef-Package CONTAINS SPDXRef-File",
+            "Relationship: SPDXRef-Package CONTAINS SPDXRef-Other-File",
+            "RelationshipComment: the comment makes this a different relationship",
+            "FileName: File in package",
+            "SPDXID: SPDXRef-File",
+            "FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2759",
+            "FileName: Other file in package",
+            "SPDXID: SPDXRef-Other-File",
+            "FileChecksum: SHA1: d6a770ba38583ed4bb4525bd96e50461655d2759",
+        ]
+    )
+    document = parser.parse(document_str)
+
+    assert document.relationships == [
+        Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-File"),
+        Relationship(
+            "SPDXRef-Package",
+            RelationshipType.CONTAINS,
+            "SPDXRef-Other-File",
+            "the comment makes this a different relationship",
+        ),
+        Relationship("SPDXRef-Package", RelationshipType.CONTAINS, "SPDXRef-Other-File"),
+    ]
@@ -63,3 +63,13 @@ def test_parse_invalid_actor(actor_string, expected_message):
         actor_parser.parse_actor(actor_string)
 
     TestCase().assertCountEqual(err.value.get_messages(), expected_message)
+
+
+def test_parse_same_actor_twice():
+    actor_parser = ActorParser()
+
+    actor = actor_parser.parse_actor("Person: Jane Doe (jane.doe@example.com)")
+    same_actor = actor_parser.parse_actor("Person: Jane Doe (jane.doe@example.com)")
+
+    assert actor == same_actor
+    assert actor is not same_actor
@@ -16,9 +16,8 @@ def test_datetime_to_iso_string_with_microseconds():
     assert datetime_to_iso_string(datetime(2022, 12, 13, 1, 2, 3, 666666)) == "2022-12-13T01:02:03Z"
 
 
-def test_datetime_from_str():
-    date_str = "2010-03-04T05:45:11Z"
-
+@pytest.mark.parametrize("date_str", ["2010-03-04T05:45:11Z", "2010-3-4T05:45:11Z"])
+def test_datetime_from_str(date_str):
     date = datetime_from_str(date_str)
 
     assert date == datetime(2010, 3, 4, 5, 45, 11)
@@ -29,6 +28,8 @@ def test_datetime_from_str():
     [
         (5, TypeError, "Could not convert str to datetime, invalid type: int"),
         ("2010-02-03", ValueError, "time data '2010-02-03' does not match format '%Y-%m-%dT%H:%M:%SZ'"),
+        ("2010-13-03T05:45:11Z", ValueError, "time data '2010-13-03T05:45:11Z' does not match format"),
+        ("2010-02-30T05:45:11Z", ValueError, "day is out of range for month"),
     ],
 )
 def test_datetime_from_str_error(invalid_date_str, error_type, expected_message):